@@ -4,7 +4,25 @@ Visualize LinkedIn Jobs Data Insights
 
 import pandas as pd
 import json
-from collections import Counter
+
+try:
+    import pyarrow  # noqa: F401  (optional: multithreaded CSV parsing)
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = 'c'
+
+# Only the columns main() reads; low-cardinality text columns load as categories
+JOB_COLUMNS = [
+    'publishedAt', 'city', 'experienceLevel', 'contractType',
+    'sector', 'applicationsCount', 'recently_posted_jobs',
+]
+CATEGORY_COLUMNS = {
+    'city': 'category',
+    'experienceLevel': 'category',
+    'contractType': 'category',
+    'sector': 'category',
+    'recently_posted_jobs': 'category',
+}
 
 def print_section(title):
     """Print formatted section header"""
@@ -14,7 +32,12 @@ def print_section(title):
 
 def main():
     # Load data
-    df = pd.read_csv('data/raw/LinkedIn_Jobs_Data_India.csv')
+    df = pd.read_csv(
+        'data/raw/LinkedIn_Jobs_Data_India.csv',
+        usecols=JOB_COLUMNS,
+        dtype=CATEGORY_COLUMNS,
+        engine=CSV_ENGINE,
+    )
     
     with open('data/extracted_job_titles.json', 'r') as f:
         titles_data = json.load(f)
@@ -36,35 +59,38 @@ def main():
     # Geographic distribution
     print_section("🗺️ GEOGRAPHIC DISTRIBUTION (Top Cities)")
     city_counts = df['city'].value_counts().head(15)
-    for i, (city, count) in enumerate(city_counts.items(), 1):
-        bar = "█" * int(count / city_counts.max() * 40)
+    # Bar lengths for all rows at once (same arithmetic as per-row int(count / max * 40))
+    city_bars = (city_counts / city_counts.max() * 40).astype(int)
+    for i, (city, count, bar_len) in enumerate(zip(city_counts.index, city_counts, city_bars), 1):
+        bar = "█" * bar_len
         print(f"{i:2d}. {city:30s} {bar} {count:3d} jobs")
     
     # Experience levels
     print_section("👔 EXPERIENCE LEVEL DISTRIBUTION")
     exp_counts = df['experienceLevel'].value_counts()
-    for exp_level, count in exp_counts.items():
-        percentage = (count / len(df)) * 100
-        bar = "█" * int(percentage / 2)
+    exp_pcts = (exp_counts / len(df)) * 100
+    exp_bars = (exp_pcts / 2).astype(int)
+    for exp_level, count, percentage, bar_len in zip(exp_counts.index, exp_counts, exp_pcts, exp_bars):
+        bar = "█" * bar_len
         print(f"   {exp_level:20s} {bar} {count:4d} ({percentage:5.1f}%)")
     
-    # Contract types
+    # Contract types (value_counts() already drops missing values)
     print_section("💼 CONTRACT TYPE DISTRIBUTION")
     contract_counts = df['contractType'].value_counts()
-    for contract_type, count in contract_counts.items():
-        if pd.notna(contract_type):
-            percentage = (count / len(df)) * 100
-            bar = "█" * int(percentage / 2)
-            print(f"   {contract_type:20s} {bar} {count:4d} ({percentage:5.1f}%)")
+    contract_pcts = (contract_counts / len(df)) * 100
+    contract_bars = (contract_pcts / 2).astype(int)
+    for contract_type, count, percentage, bar_len in zip(
+        contract_counts.index, contract_counts, contract_pcts, contract_bars
+    ):
+        bar = "█" * bar_len
+        print(f"   {contract_type:20s} {bar} {count:4d} ({percentage:5.1f}%)")
     
     # Sectors
     print_section("🏢 TOP SECTORS")
     sector_counts = df['sector'].value_counts().head(10)
-    for i, (sector, count) in enumerate(sector_counts.items(), 1):
-        if pd.notna(sector):
-            percentage = (count / len(df)) * 100
-            bar = "█" * int(count / sector_counts.max() * 40)
-            print(f"{i:2d}. {sector[:50]:50s} {count:3d} ({percentage:4.1f}%)")
+    sector_pcts = (sector_counts / len(df)) * 100
+    for i, (sector, count, percentage) in enumerate(zip(sector_counts.index, sector_counts, sector_pcts), 1):
+        print(f"{i:2d}. {sector[:50]:50s} {count:3d} ({percentage:4.1f}%)")
     
     # Job roles in our project
     print_section("🎯 PROJECT JOB ROLES (From LinkedIn Data)")
@@ -82,8 +108,9 @@ def main():
     total_covered = sum(project_roles.values())
     coverage_pct = (total_covered / len(df)) * 100
     
+    max_role_count = max(project_roles.values())
     for i, (role, count) in enumerate(sorted(project_roles.items(), key=lambda x: x[1], reverse=True), 1):
-        bar = "█" * int(count / max(project_roles.values()) * 40)
+        bar = "█" * int(count / max_role_count * 40)
         print(f"{i}. {role:35s} {bar} {count:3d} jobs")
     
     print(f"\n   Total Coverage: {total_covered} jobs ({coverage_pct:.1f}% of dataset)")
@@ -116,8 +143,8 @@ def main():
     # Recently posted jobs
     print_section("⏰ RECENT JOB POSTINGS")
     recent = df['recently_posted_jobs'].value_counts()
-    for status, count in recent.items():
-        percentage = (count / len(df)) * 100
+    recent_pcts = (recent / len(df)) * 100
+    for status, count, percentage in zip(recent.index, recent, recent_pcts):
         print(f"   {status:10s}: {count:4d} jobs ({percentage:5.1f}%)")
     
     # Summary
@@ -178,17 +178,17 @@ class CareerAnalyzer:
         result = AnalysisResult(resume_name=resume.name)
         resume_skills = resume.get_all_skills()
         
-        for job_role in roles_to_analyze:
-            # Match skills
-            skill_match_result = self.skill_matcher.match_skills(resume_skills, job_role)
+        # One matching pass over all roles: resume skills are normalized once
+        # and requirements shared between roles are only fuzzy-matched once
+        skill_match_results = self.skill_matcher.match_skills_batch(resume_skills, roles_to_analyze)
+        
+        for job_role, skill_match_result in zip(roles_to_analyze, skill_match_results):
+            score_result = self.score_calculator.calculate_score(resume, job_role, skill_match_result)
             
-            # Calculate score
-            score_result = self.score_calculator.calculate_score(
-                resume, job_role, skill_match_result
+            # Analyze skill gaps (reusing the match result)
+            skill_gaps = self.skill_gap_analyzer.analyze_gaps(
+                resume_skills, job_role, skill_match_result
             )
-            
-            # Analyze skill gaps
-            skill_gaps = self.skill_gap_analyzer.analyze_gaps(resume_skills, job_role)
             result.skill_gaps[job_role.name] = skill_gaps
             
             # Generate roadmap
@@ -247,13 +247,13 @@ class CareerAnalyzer:
         top_role = result.top_roles[0]
         top_score = result.get_role_score(top_role) or 0.0
         
-        summary = f"Top Recommendation: {top_role} (Score: {top_score:.1f}/100)\n\n"
+        parts = [f"Top Recommendation: {top_role} (Score: {top_score:.1f}/100)\n\n"]
         
         if len(result.top_roles) > 1:
-            summary += f"Other suitable roles: {', '.join(result.top_roles[1:3])}\n\n"
+            parts.append(f"Other suitable roles: {', '.join(result.top_roles[1:3])}\n\n")
         
         if result.predicted_roles:
-            summary += f"Consider exploring: {', '.join(result.predicted_roles[:2])}\n"
+            parts.append(f"Consider exploring: {', '.join(result.predicted_roles[:2])}\n")
         
-        return summary
+        return "".join(parts)
 
@@ -1,6 +1,7 @@
 """Score calculator - calculates job readiness scores."""
 
-from typing import Dict
+from typing import Dict, Tuple, Union
+import numpy as np
 import yaml
 from pathlib import Path
 from src.models.resume import Resume
@@ -65,21 +66,17 @@ class ScoreCalculator:
             skill_match_result, job_role
         )
         
-        experience_score = self._calculate_experience_score(resume, job_role)
-        education_score = self._calculate_education_score(resume, job_role)
-        certifications_score = self._calculate_certifications_score(resume, job_role)
-        
-        # Calculate weighted overall score
-        overall_score = (
-            required_skills_score * self.weights['required_skills'] / 100 +
-            preferred_skills_score * self.weights['preferred_skills'] / 100 +
-            experience_score * self.weights['experience'] / 100 +
-            education_score * self.weights['education'] / 100 +
-            certifications_score * self.weights['certifications'] / 100
+        experience_score, education_score, certifications_score = (
+            self.calculate_non_skill_scores(resume, job_role)
         )
         
-        # Ensure score is between 0 and 100
-        overall_score = max(0, min(100, overall_score))
+        overall_score = self.calculate_overall_score(
+            required_skills_score,
+            preferred_skills_score,
+            experience_score,
+            education_score,
+            certifications_score,
+        )
         
         return {
             'overall_score': round(overall_score, 2),
@@ -100,6 +97,57 @@ class ScoreCalculator:
             }
         }
     
+    def calculate_non_skill_scores(
+        self,
+        resume: Resume,
+        job_role: JobRole
+    ) -> Tuple[float, float, float]:
+        """
+        Calculate the component scores that don't depend on skill matching.
+        
+        Args:
+            resume: Resume object
+            job_role: Job role to score against
+            
+        Returns:
+            Tuple of (experience, education, certifications) scores
+        """
+        return (
+            self._calculate_experience_score(resume, job_role),
+            self._calculate_education_score(resume, job_role),
+            self._calculate_certifications_score(resume, job_role),
+        )
+    
+    def calculate_overall_score(
+        self,
+        required_skills_score: Union[float, np.ndarray],
+        preferred_skills_score: Union[float, np.ndarray],
+        experience_score: Union[float, np.ndarray],
+        education_score: Union[float, np.ndarray],
+        certifications_score: Union[float, np.ndarray]
+    ) -> Union[float, np.ndarray]:
+        """
+        Combine component scores into the weighted overall score.
+        
+        Accepts floats or equal-length NumPy arrays (one entry per role); the
+        result is clamped to 0-100 but not rounded.
+        
+        Returns:
+            Overall score(s), same shape as the inputs
+        """
+        overall_score = (
+            required_skills_score * self.weights['required_skills'] / 100 +
+            preferred_skills_score * self.weights['preferred_skills'] / 100 +
+            experience_score * self.weights['experience'] / 100 +
+            education_score * self.weights['education'] / 100 +
+            certifications_score * self.weights['certifications'] / 100
+        )
+        
+        # Ensure score is between 0 and 100
+        if isinstance(overall_score, np.ndarray):
+            return np.clip(overall_score, 0, 100)
+        return max(0, min(100, overall_score))
+    
     def _calculate_required_skills_score(self, skill_match_result: Dict, job_role: JobRole) -> float:
         """Calculate score based on required skills match."""
         matched_count = len(skill_match_result['matched_required'])
@@ -2,10 +2,40 @@
 
 import json
 import os
+import re
 from typing import List, Set, Dict
 from pathlib import Path
 from src.models.resume import Resume
-from src.utils.text_processor import normalize_skill_name, clean_text
+from src.utils.text_processor import normalize_skill_name, clean_text, KeywordScanner
+
+
+# Common technical skills matched as whole words, in addition to the taxonomy
+_COMMON_SKILL_PATTERNS = tuple(
+    (re.compile(pattern), skill_name)
+    for pattern, skill_name in (
+        (r'\bpython\b', 'Python'),
+        (r'\bjava\b', 'Java'),
+        (r'\bjavascript\b', 'JavaScript'),
+        (r'\bjava\s*script\b', 'JavaScript'),
+        (r'\btypescript\b', 'TypeScript'),
+        (r'\bsql\b', 'SQL'),
+        (r'\bhtml\b', 'HTML'),
+        (r'\bcss\b', 'CSS'),
+        (r'\baws\b', 'AWS'),
+        (r'\bdocker\b', 'Docker'),
+        (r'\bkubernetes\b', 'Kubernetes'),
+        (r'\bmachine\s+learning\b', 'Machine Learning'),
+        (r'\bdeep\s+learning\b', 'Deep Learning'),
+        (r'\bdata\s+science\b', 'Data Science'),
+        (r'\btensorflow\b', 'TensorFlow'),
+        (r'\bkeras\b', 'Keras'),
+        (r'\bpytorch\b', 'PyTorch'),
+        (r'\bscikit-learn\b', 'Scikit-learn'),
+        (r'\bscikit\s+learn\b', 'Scikit-learn'),
+        (r'\bgit\b', 'Git'),
+        (r'\bgithub\b', 'GitHub'),
+    )
+)
 
 
 class SkillExtractor:
@@ -59,6 +89,12 @@ class SkillExtractor:
                     for synonym in synonyms:
                         normalized_syn = normalize_skill_name(synonym)
                         self.normalized_to_canonical[normalized_syn] = canonical
+        
+        # All taxonomy names in one scanner, so a text is scanned once rather
+        # than once per name ('' matches any text, so it is handled apart)
+        self._skill_scanner = KeywordScanner(
+            (name for name in self.normalized_to_canonical if name), cache_size=32
+        )
     
     def extract_skills(self, resume: Resume) -> List[str]:
         """
@@ -111,39 +147,14 @@ class SkillExtractor:
         found_skills: Set[str] = set()
         
         # Match against normalized skill names
-        for normalized, canonical in self.normalized_to_canonical.items():
-            # Check if skill name appears in text
-            if normalized in text_lower:
-                found_skills.add(canonical)
+        for normalized in self._skill_scanner.scan(text_lower):
+            found_skills.add(self.normalized_to_canonical[normalized])
+        if '' in self.normalized_to_canonical:
+            found_skills.add(self.normalized_to_canonical[''])
         
         # Also check for common technical skills patterns
-        common_patterns = {
-            r'\bpython\b': 'Python',
-            r'\bjava\b': 'Java',
-            r'\bjavascript\b': 'JavaScript',
-            r'\bjava\s*script\b': 'JavaScript',
-            r'\btypescript\b': 'TypeScript',
-            r'\bsql\b': 'SQL',
-            r'\bhtml\b': 'HTML',
-            r'\bcss\b': 'CSS',
-            r'\baws\b': 'AWS',
-            r'\bdocker\b': 'Docker',
-            r'\bkubernetes\b': 'Kubernetes',
-            r'\bmachine\s+learning\b': 'Machine Learning',
-            r'\bdeep\s+learning\b': 'Deep Learning',
-            r'\bdata\s+science\b': 'Data Science',
-            r'\btensorflow\b': 'TensorFlow',
-            r'\bkeras\b': 'Keras',
-            r'\bpytorch\b': 'PyTorch',
-            r'\bscikit-learn\b': 'Scikit-learn',
-            r'\bscikit\s+learn\b': 'Scikit-learn',
-            r'\bgit\b': 'Git',
-            r'\bgithub\b': 'GitHub',
-        }
-        
-        import re
-        for pattern, skill_name in common_patterns.items():
-            if re.search(pattern, text_lower):
+        for pattern, skill_name in _COMMON_SKILL_PATTERNS:
+            if pattern.search(text_lower):
                 found_skills.add(skill_name)
         
         return list(found_skills)
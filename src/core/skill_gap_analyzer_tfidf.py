@@ -105,8 +105,9 @@ class SkillGapAnalyzerTFIDF:
         skill_vectors = self.vectorizer.fit_transform(unique_skills)
         
         # Get vectors for resume and job skills
-        resume_indices = [unique_skills.index(s) for s in resume_skills if s in unique_skills]
-        job_indices = [unique_skills.index(s) for s in job_role_skills if s in unique_skills]
+        skill_index = {s: i for i, s in enumerate(unique_skills)}
+        resume_indices = [skill_index[s] for s in resume_skills if s in skill_index]
+        job_indices = [skill_index[s] for s in job_role_skills if s in skill_index]
         
         resume_vectors = skill_vectors[resume_indices] if resume_indices else None
         job_vectors = skill_vectors[job_indices] if job_indices else None
@@ -131,15 +132,17 @@ class SkillGapAnalyzerTFIDF:
         ]
         
         # Step 6: Identify extra skills (resume skills not matched)
-        resume_matched_indices = [m['resume_index'] for m in matched_skills]
+        resume_matched_indices = {m['resume_index'] for m in matched_skills}
         extra_skills = [
             resume_skills[i] for i in range(len(resume_skills))
             if i not in resume_matched_indices
         ]
         
         # Step 7: Categorize missing skills (required vs preferred)
-        missing_required = [s for s in missing_skills if s in required_skills]
-        missing_preferred = [s for s in missing_skills if s in preferred_skills]
+        required_set = set(required_skills)
+        preferred_set = set(preferred_skills)
+        missing_required = [s for s in missing_skills if s in required_set]
+        missing_preferred = [s for s in missing_skills if s in preferred_set]
         
         # Step 8: Generate explanations
         explanations = self._generate_explanations(
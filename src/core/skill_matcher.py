@@ -1,6 +1,6 @@
 """Skill matcher - matches resume skills with job requirements."""
 
-from typing import List, Dict, Tuple
+from typing import Iterable, List, Dict, Optional, Tuple
 from fuzzywuzzy import fuzz
 from src.models.job_role import JobRole, SkillRequirement
 from src.utils.text_processor import normalize_skill_name
@@ -40,18 +40,62 @@ class SkillMatcher:
             - missing_preferred: List of missing preferred skills
             - match_details: Detailed matching information
         """
-        resume_skills_normalized = {normalize_skill_name(s): s for s in resume_skills}
+        return self._match_prepared(self.prepare_resume_skills(resume_skills), job_role)
+    
+    def match_skills_batch(
+        self,
+        resume_skills: List[str],
+        job_roles: Iterable[JobRole]
+    ) -> List[Dict[str, any]]:
+        """
+        Match one resume's skills against several job roles.
+        
+        The resume skills are normalized once, and each distinct requirement
+        is checked once: roles that share a skill (e.g. "Python") reuse its
+        exact/fuzzy match outcome instead of re-running the fuzzy scan.
+        
+        Args:
+            resume_skills: List of skills from resume
+            job_roles: Job roles to match against
+            
+        Returns:
+            One match result per role, in the same shape as match_skills()
+        """
+        resume_skills_normalized = self.prepare_resume_skills(resume_skills)
+        covered: Dict[str, bool] = {}
+        return [
+            self._match_prepared(resume_skills_normalized, job_role, covered)
+            for job_role in job_roles
+        ]
+    
+    @staticmethod
+    def prepare_resume_skills(resume_skills: Iterable[str]) -> Dict[str, str]:
+        """Map normalized resume skills to their original spelling."""
+        return {normalize_skill_name(s): s for s in resume_skills}
+    
+    def _match_prepared(
+        self,
+        resume_skills_normalized: Dict[str, str],
+        job_role: JobRole,
+        covered: Optional[Dict[str, bool]] = None
+    ) -> Dict[str, any]:
+        """Match already-normalized resume skills against one role."""
+        skill_arrays = job_role.get_skill_arrays()
         
         # Match required skills
         matched_required, missing_required = self._match_skill_list(
             resume_skills_normalized,
-            job_role.required_skills
+            job_role.required_skills,
+            skill_arrays.required_normalized,
+            covered
         )
         
         # Match preferred skills
         matched_preferred, missing_preferred = self._match_skill_list(
             resume_skills_normalized,
-            job_role.preferred_skills
+            job_role.preferred_skills,
+            skill_arrays.preferred_normalized,
+            covered
         )
         
         return {
@@ -66,7 +110,9 @@ class SkillMatcher:
     def _match_skill_list(
         self,
         resume_skills: Dict[str, str],  # normalized -> original
-        required_skills: List[SkillRequirement]
+        required_skills: List[SkillRequirement],
+        required_normalized: Tuple[str, ...],  # parallel to required_skills
+        covered: Optional[Dict[str, bool]] = None  # normalized requirement -> matched, shared per resume
     ) -> Tuple[List[str], List[SkillRequirement]]:
         """
         Match a list of required skills with resume skills.
@@ -77,37 +123,52 @@ class SkillMatcher:
         matched = []
         missing = []
         
-        for req in required_skills:
-            req_skill_normalized = normalize_skill_name(req.skill)
-            
-            # Exact match
-            if req_skill_normalized in resume_skills:
-                matched.append(req.skill)
-                continue
-            
-            # Fuzzy match
-            best_match = None
-            best_score = 0
-            
-            for resume_skill_norm, resume_skill_orig in resume_skills.items():
-                # Check substring match first (faster)
-                if req_skill_normalized in resume_skill_norm or resume_skill_norm in req_skill_normalized:
-                    score = 100
-                else:
-                    # Use fuzzy matching
-                    score = fuzz.ratio(req_skill_normalized, resume_skill_norm)
-                
-                if score > best_score and score >= self.fuzzy_threshold:
-                    best_score = score
-                    best_match = resume_skill_orig
-            
-            if best_match:
+        for req, req_normalized in zip(required_skills, required_normalized):
+            if covered is None:
+                is_match = self.has_match(req_normalized, resume_skills)
+            else:
+                is_match = covered.get(req_normalized)
+                if is_match is None:
+                    is_match = covered[req_normalized] = self.has_match(req_normalized, resume_skills)
+            if is_match:
                 matched.append(req.skill)  # Use canonical name from requirement
             else:
                 missing.append(req)
         
         return matched, missing
     
+    def has_match(
+        self,
+        req_skill_normalized: str,
+        resume_skills: Dict[str, str]  # normalized -> original
+    ) -> bool:
+        """
+        Check whether a normalized requirement is covered by any resume skill.
+        
+        Tries an exact match first, then substring and fuzzy matching.
+        """
+        # Exact match
+        if req_skill_normalized in resume_skills:
+            return True
+        
+        # Fuzzy match
+        best_match = None
+        best_score = 0
+        
+        for resume_skill_norm, resume_skill_orig in resume_skills.items():
+            # Check substring match first (faster)
+            if req_skill_normalized in resume_skill_norm or resume_skill_norm in req_skill_normalized:
+                score = 100
+            else:
+                # Use fuzzy matching
+                score = fuzz.ratio(req_skill_normalized, resume_skill_norm)
+            
+            if score > best_score and score >= self.fuzzy_threshold:
+                best_score = score
+                best_match = resume_skill_orig
+        
+        return bool(best_match)
+    
     def calculate_skill_similarity(self, skill1: str, skill2: str) -> float:
         """
         Calculate similarity between two skills.
@@ -7,12 +7,16 @@ Uses mysql-connector-python for MySQL connectivity.
 
 import mysql.connector
 from mysql.connector import Error
-import json
 import hashlib
+import orjson
 import os
 from datetime import datetime
 from typing import Optional, Dict, List, Any
 
+# Pre-encoded JSON for empty/missing values so they skip the encoder entirely.
+_EMPTY_LIST = "[]"
+_EMPTY_OBJ = "{}"
+_JSON_OPTS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
 
 class DatabaseManager:
     """Manages MySQL database connections and operations."""
@@ -78,7 +82,7 @@ class DatabaseManager:
                 id INT AUTO_INCREMENT PRIMARY KEY,
                 username VARCHAR(100) UNIQUE NOT NULL,
                 email VARCHAR(255) UNIQUE NOT NULL,
-                password_hash VARCHAR(255) NOT NULL,
+                password_hash BINARY(32) NOT NULL,
                 full_name VARCHAR(255),
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 last_login TIMESTAMP NULL,
@@ -114,10 +118,15 @@ class DatabaseManager:
                 roadmap_data JSON,
                 interview_questions JSON,
                 session_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                matched_count INT AS (COALESCE(JSON_LENGTH(matched_skills), 0)) STORED,
+                missing_count INT AS (COALESCE(JSON_LENGTH(missing_skills), 0)) STORED,
+                INDEX idx_sessions_user_matched (user_id, matched_count),
                 FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
                 FOREIGN KEY (resume_id) REFERENCES resume_uploads(id) ON DELETE SET NULL
             )
         """)
+        self._add_session_count_columns(cursor)
+        self._migrate_password_hash(cursor)
 
         # User progress tracking table
         cursor.execute("""
@@ -152,12 +161,76 @@ class DatabaseManager:
         self.connection.commit()
         cursor.close()
 
+    def _add_session_count_columns(self, cursor):
+        """Add the generated skill-count columns to pre-existing session tables."""
+        cursor.execute("""
+            SELECT COUNT(*) AS n FROM INFORMATION_SCHEMA.COLUMNS
+            WHERE TABLE_SCHEMA = %s AND TABLE_NAME = 'analysis_sessions'
+              AND COLUMN_NAME = 'matched_count'
+        """, (self.database,))
+        if cursor.fetchone()['n']:
+            return
+        cursor.execute("""
+            ALTER TABLE analysis_sessions
+            ADD COLUMN matched_count INT AS (COALESCE(JSON_LENGTH(matched_skills), 0)) STORED,
+            ADD COLUMN missing_count INT AS (COALESCE(JSON_LENGTH(missing_skills), 0)) STORED,
+            ADD INDEX idx_sessions_user_matched (user_id, matched_count)
+        """)
+
+    def _migrate_password_hash(self, cursor):
+        """Convert legacy hex VARCHAR password hashes to raw BINARY(32) digests."""
+        cursor.execute("""
+            SELECT DATA_TYPE AS data_type FROM INFORMATION_SCHEMA.COLUMNS
+            WHERE TABLE_SCHEMA = %s AND TABLE_NAME = 'users'
+              AND COLUMN_NAME = 'password_hash'
+        """, (self.database,))
+        row = cursor.fetchone()
+        if not row:
+            return
+        # Some connector versions return INFORMATION_SCHEMA values as bytes
+        data_type = row['data_type']
+        if isinstance(data_type, (bytes, bytearray)):
+            data_type = data_type.decode()
+        if data_type.lower() == 'binary':
+            return
+        # Anything that isn't a 64-char hex digest (or an already converted
+        # 32-byte one) would be truncated/padded by BINARY(32); refuse instead
+        cursor.execute("""
+            SELECT COUNT(*) AS bad FROM users
+            WHERE LENGTH(password_hash) NOT IN (32, 64)
+               OR (LENGTH(password_hash) = 64
+                   AND password_hash NOT REGEXP '^[0-9A-Fa-f]{64}$')
+        """)
+        bad = cursor.fetchone()['bad']
+        if bad:
+            raise Error(
+                msg=f"password_hash migration aborted: {bad} user(s) have a hash "
+                    "that is not a 64-character hex SHA-256 digest"
+            )
+        # Go through VARBINARY so UNHEX() output is never validated as utf8mb4.
+        cursor.execute("ALTER TABLE users MODIFY password_hash VARBINARY(255) NOT NULL")
+        cursor.execute("""
+            UPDATE users SET password_hash = UNHEX(password_hash)
+            WHERE LENGTH(password_hash) = 64
+        """)
+        self.connection.commit()
+        cursor.execute("ALTER TABLE users MODIFY password_hash BINARY(32) NOT NULL")
+
+    # ─── Serialization ─────────────────────────────────────────────
+
+    @staticmethod
+    def _to_json(value: Any, empty: Optional[str] = _EMPTY_LIST) -> Optional[str]:
+        """Serialize a value for a JSON column; falsy values map to ``empty`` (``None`` stores NULL)."""
+        if not value:
+            return empty
+        return orjson.dumps(value, default=str, option=_JSON_OPTS).decode()
+
     # ─── User Management ───────────────────────────────────────────
 
-    def _hash_password(self, password: str) -> str:
-        """Hash password using SHA-256 with salt."""
+    def _hash_password(self, password: str) -> bytes:
+        """Hash password using SHA-256 with salt (raw 32-byte digest)."""
         salt = "career_analyzer_salt_2024"
-        return hashlib.sha256(f"{password}{salt}".encode()).hexdigest()
+        return hashlib.sha256(f"{password}{salt}".encode()).digest()
 
     def register_user(self, username: str, email: str, password: str,
                       full_name: str = "") -> Dict[str, Any]:
@@ -239,8 +312,8 @@ class DatabaseManager:
             cursor.execute("""
                 INSERT INTO resume_uploads (user_id, filename, parsed_data, skills_extracted)
                 VALUES (%s, %s, %s, %s)
-            """, (user_id, filename, json.dumps(parsed_data, default=str),
-                  json.dumps(skills)))
+            """, (user_id, filename, self._to_json(parsed_data, _EMPTY_OBJ),
+                  self._to_json(skills)))
 
             self.connection.commit()
             resume_id = cursor.lastrowid
@@ -265,8 +338,8 @@ class DatabaseManager:
             cursor.close()
 
             for r in resumes:
-                if r.get('skills_extracted') and isinstance(r['skills_extracted'], str):
-                    r['skills_extracted'] = json.loads(r['skills_extracted'])
+                if r.get('skills_extracted') and isinstance(r['skills_extracted'], (str, bytes)):
+                    r['skills_extracted'] = orjson.loads(r['skills_extracted'])
             return resumes
         except Error as e:
             print(f"Error fetching resumes: {e}")
@@ -283,10 +356,10 @@ class DatabaseManager:
             cursor.close()
 
             if resume:
-                if resume.get('parsed_data') and isinstance(resume['parsed_data'], str):
-                    resume['parsed_data'] = json.loads(resume['parsed_data'])
-                if resume.get('skills_extracted') and isinstance(resume['skills_extracted'], str):
-                    resume['skills_extracted'] = json.loads(resume['skills_extracted'])
+                if resume.get('parsed_data') and isinstance(resume['parsed_data'], (str, bytes)):
+                    resume['parsed_data'] = orjson.loads(resume['parsed_data'])
+                if resume.get('skills_extracted') and isinstance(resume['skills_extracted'], (str, bytes)):
+                    resume['skills_extracted'] = orjson.loads(resume['skills_extracted'])
             return resume
         except Error as e:
             print(f"Error fetching resume: {e}")
@@ -312,12 +385,12 @@ class DatabaseManager:
                 VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
             """, (
                 user_id, resume_id, target_role, readiness_score,
-                json.dumps(matched_skills, default=str),
-                json.dumps(missing_skills, default=str),
-                json.dumps(skill_gap_results, default=str) if skill_gap_results else None,
-                json.dumps(suitability_results, default=str) if suitability_results else None,
-                json.dumps(roadmap_data, default=str) if roadmap_data else None,
-                json.dumps(interview_questions, default=str) if interview_questions else None
+                self._to_json(matched_skills),
+                self._to_json(missing_skills),
+                self._to_json(skill_gap_results, empty=None),
+                self._to_json(suitability_results, empty=None),
+                self._to_json(roadmap_data, empty=None),
+                self._to_json(interview_questions, empty=None)
             ))
 
             self.connection.commit()
@@ -329,12 +402,17 @@ class DatabaseManager:
             return None
 
     def get_user_sessions(self, user_id: int, limit: int = 20) -> List[Dict]:
-        """Get analysis history for a user."""
+        """
+        Get analysis history for a user.
+
+        Only the generated skill counts are returned; use
+        get_session_skills() to load the skill lists for one session.
+        """
         try:
             cursor = self._get_cursor()
             cursor.execute("""
                 SELECT id, target_role, readiness_score, session_date,
-                       matched_skills, missing_skills
+                       matched_count, missing_count
                 FROM analysis_sessions
                 WHERE user_id = %s
                 ORDER BY session_date DESC
@@ -343,16 +421,32 @@ class DatabaseManager:
 
             sessions = cursor.fetchall()
             cursor.close()
-
-            for s in sessions:
-                for field in ['matched_skills', 'missing_skills']:
-                    if s.get(field) and isinstance(s[field], str):
-                        s[field] = json.loads(s[field])
             return sessions
         except Error as e:
             print(f"Error fetching sessions: {e}")
             return []
 
+    def get_session_skills(self, session_id: int) -> Dict[str, List]:
+        """Get the matched/missing skill lists for a single session."""
+        try:
+            cursor = self._get_cursor()
+            cursor.execute("""
+                SELECT matched_skills, missing_skills
+                FROM analysis_sessions WHERE id = %s
+            """, (session_id,))
+            row = cursor.fetchone()
+            cursor.close()
+
+            skills = {"matched_skills": [], "missing_skills": []}
+            if row:
+                for field in skills:
+                    if row.get(field):
+                        skills[field] = orjson.loads(row[field])
+            return skills
+        except Error as e:
+            print(f"Error fetching session skills: {e}")
+            return {"matched_skills": [], "missing_skills": []}
+
     def get_session_by_id(self, session_id: int) -> Optional[Dict]:
         """Get full session details."""
         try:
@@ -365,8 +459,8 @@ class DatabaseManager:
                 json_fields = ['matched_skills', 'missing_skills', 'skill_gap_results',
                                'suitability_results', 'roadmap_data', 'interview_questions']
                 for field in json_fields:
-                    if session.get(field) and isinstance(session[field], str):
-                        session[field] = json.loads(session[field])
+                    if session.get(field) and isinstance(session[field], (str, bytes)):
+                        session[field] = orjson.loads(session[field])
             return session
         except Error as e:
             print(f"Error fetching session: {e}")
@@ -444,7 +538,7 @@ class DatabaseManager:
             cursor.execute("""
                 INSERT INTO reports (user_id, session_id, report_type, report_data)
                 VALUES (%s, %s, %s, %s)
-            """, (user_id, session_id, report_type, json.dumps(report_data, default=str)))
+            """, (user_id, session_id, report_type, self._to_json(report_data, empty=_EMPTY_OBJ)))
 
             self.connection.commit()
             report_id = cursor.lastrowid
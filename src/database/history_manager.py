@@ -8,10 +8,14 @@ Database file: <project_root>/database.db
 """
 
 import sqlite3
-import json
 import os
-from datetime import datetime
-from typing import Optional, List, Dict, Any
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Tuple
+
+import orjson
 
 # ── Resolve DB path relative to project root ──────────────────────────────────
 _HERE        = os.path.dirname(os.path.abspath(__file__))
@@ -19,14 +23,54 @@ _PROJECT_ROOT = os.path.abspath(os.path.join(_HERE, "..", ".."))
 DB_PATH      = os.path.join(_PROJECT_ROOT, "database.db")
 
 
+# ── Read-through cache for per-render lookups ─────────────────────────────────
+# get_all_profiles / get_distinct_roles are hit on every dashboard rerun; keep
+# their results for a short TTL and drop them on any write that changes them.
+_CACHE_TTL      = 30.0
+_cache_lock     = threading.Lock()
+_profiles_cache: Optional[tuple] = None               # (stamp, rows)
+_roles_cache:    Dict[int, tuple] = {}                # profile_id -> (stamp, roles)
+
+
+def _invalidate_profiles() -> None:
+    global _profiles_cache
+    with _cache_lock:
+        _profiles_cache = None
+
+
+def _invalidate_roles(profile_id: Optional[int] = None) -> None:
+    with _cache_lock:
+        if profile_id is None:
+            _roles_cache.clear()
+        else:
+            _roles_cache.pop(profile_id, None)
+
+
 def _conn() -> sqlite3.Connection:
-    c = sqlite3.connect(DB_PATH)
+    # Autocommit: readers never open a transaction, so WAL lets them run
+    # lock-free; writers that need atomicity use _write_tx().
+    c = sqlite3.connect(DB_PATH, isolation_level=None, check_same_thread=False)
     c.row_factory = sqlite3.Row
     c.execute("PRAGMA journal_mode=WAL;")
+    c.execute("PRAGMA synchronous=NORMAL;")
+    c.execute("PRAGMA wal_autocheckpoint=1000;")
+    c.execute("PRAGMA temp_store=MEMORY;")
     c.execute("PRAGMA foreign_keys=ON;")
     return c
 
 
+@contextmanager
+def _write_tx(con: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """Run a block inside BEGIN IMMEDIATE so the write lock is taken up front."""
+    con.execute("BEGIN IMMEDIATE")
+    try:
+        yield con
+        con.execute("COMMIT")
+    except BaseException:
+        con.execute("ROLLBACK")
+        raise
+
+
 def _init() -> None:
     """Create tables once on first import."""
     con = _conn()
@@ -53,7 +97,9 @@ def _init() -> None:
                 matched_count    INTEGER DEFAULT 0,
                 missing_count    INTEGER DEFAULT 0,
                 notes            TEXT    DEFAULT '',
-                saved_at         TEXT    DEFAULT (datetime('now'))
+                saved_at         TEXT    DEFAULT (datetime('now')),
+                target_role_norm TEXT    GENERATED ALWAYS
+                                   AS (lower(trim(target_role))) VIRTUAL
             );
 
             CREATE TABLE IF NOT EXISTS skill_progress (
@@ -65,7 +111,27 @@ def _init() -> None:
                 updated_at TEXT    DEFAULT (datetime('now')),
                 UNIQUE(profile_id, skill_name)
             );
+
+        """)
+        # Databases created before target_role_norm existed: SQLite can only
+        # ALTER in VIRTUAL generated columns, which is what CREATE uses too.
+        cols = {r["name"] for r in con.execute("PRAGMA table_xinfo(score_snapshots)")}
+        if "target_role_norm" not in cols:
+            con.execute(
+                """ALTER TABLE score_snapshots ADD COLUMN target_role_norm TEXT
+                   GENERATED ALWAYS AS (lower(trim(target_role))) VIRTUAL"""
+            )
+        con.executescript("""
+            -- Role lookups go through the normalised column; skill_progress is
+            -- covered by its UNIQUE key.
+            DROP INDEX IF EXISTS idx_snap_profile_role_time;
+            CREATE INDEX IF NOT EXISTS idx_snap_profile_rolenorm_time
+                ON score_snapshots(profile_id, target_role_norm, saved_at);
+
+            CREATE INDEX IF NOT EXISTS idx_snap_profile_time
+                ON score_snapshots(profile_id, saved_at);
         """)
+    con.execute("PRAGMA optimize;")
     con.close()
 
 
@@ -79,40 +145,58 @@ def get_or_create_profile(username: str, full_name: str = "") -> int:
     if not username:
         raise ValueError("username cannot be empty")
     con = _conn()
-    with con:
+    with _write_tx(con):
         row = con.execute(
             "SELECT id FROM profiles WHERE username=?", (username,)
         ).fetchone()
-        if row:
-            con.close()
-            return int(row["id"])
-        cur = con.execute(
-            "INSERT INTO profiles (username, full_name) VALUES (?,?)",
-            (username, full_name.strip())
-        )
-        pid = cur.lastrowid
+        created = row is None
+        if created:
+            row = con.execute(
+                "INSERT INTO profiles (username, full_name) VALUES (?,?) RETURNING id",
+                (username, full_name.strip())
+            ).fetchone()
     con.close()
-    return pid
+    if created:
+        _invalidate_profiles()
+    return int(row["id"])
 
 
 def get_all_profiles() -> List[Dict[str, Any]]:
+    global _profiles_cache
+    with _cache_lock:
+        entry = _profiles_cache
+    if entry and time.monotonic() - entry[0] < _CACHE_TTL:
+        return [dict(r) for r in entry[1]]
     con = _conn()
     rows = con.execute(
         "SELECT id, username, full_name, created_at FROM profiles ORDER BY username"
     ).fetchall()
     con.close()
-    return [dict(r) for r in rows]
+    profiles = [dict(r) for r in rows]
+    with _cache_lock:
+        _profiles_cache = (time.monotonic(), profiles)
+    return [dict(r) for r in profiles]
 
 
 def delete_profile(profile_id: int) -> None:
     con = _conn()
-    with con:
-        con.execute("DELETE FROM profiles WHERE id=?", (profile_id,))
+    con.execute("DELETE FROM profiles WHERE id=?", (profile_id,))
     con.close()
+    _invalidate_profiles()
+    _invalidate_roles(profile_id)
 
 
 # ── Score snapshots ───────────────────────────────────────────────────────────
 
+def _decode_snapshot(row: sqlite3.Row) -> Dict[str, Any]:
+    # Both skill columns default to '[]', so one orjson pass per field suffices.
+    snap = dict(row)
+    snap.pop("target_role_norm", None)  # internal lookup key, not part of a snapshot
+    snap["matched_skills"] = orjson.loads(row["matched_skills"] or "[]")
+    snap["missing_skills"] = orjson.loads(row["missing_skills"] or "[]")
+    return snap
+
+
 def save_score_snapshot(
     profile_id: int,
     target_role: str,
@@ -127,14 +211,15 @@ def save_score_snapshot(
     matched_skills = matched_skills or []
     missing_skills = missing_skills or []
     con = _conn()
-    with con:
-        cur = con.execute(
+    with _write_tx(con):
+        sid = con.execute(
             """INSERT INTO score_snapshots
                (profile_id, target_role, overall_score, skills_score,
                 experience_score, projects_score,
                 matched_skills, missing_skills,
                 matched_count, missing_count, notes)
-               VALUES (?,?,?,?,?,?,?,?,?,?,?)""",
+               VALUES (?,?,?,?,?,?,?,?,?,?,?)
+               RETURNING id""",
             (
                 profile_id,
                 target_role.strip(),
@@ -142,15 +227,15 @@ def save_score_snapshot(
                 round(float(skills_score), 2),
                 round(float(experience_score), 2),
                 round(float(projects_score), 2),
-                json.dumps(matched_skills),
-                json.dumps(missing_skills),
+                orjson.dumps(matched_skills, default=str).decode(),
+                orjson.dumps(missing_skills, default=str).decode(),
                 len(matched_skills),
                 len(missing_skills),
                 notes,
             ),
-        )
-        sid = cur.lastrowid
+        ).fetchone()[0]
     con.close()
+    _invalidate_roles(profile_id)
     return sid
 
 
@@ -163,9 +248,9 @@ def get_snapshots_for_profile(
     if target_role:
         rows = con.execute(
             """SELECT * FROM score_snapshots
-               WHERE profile_id=? AND target_role=?
+               WHERE profile_id=? AND target_role_norm=lower(trim(?))
                ORDER BY saved_at ASC LIMIT ?""",
-            (profile_id, target_role.strip(), limit),
+            (profile_id, target_role, limit),
         ).fetchall()
     else:
         rows = con.execute(
@@ -175,65 +260,103 @@ def get_snapshots_for_profile(
             (profile_id, limit),
         ).fetchall()
     con.close()
-    result = []
+    return [_decode_snapshot(r) for r in rows]
+
+
+def get_snapshots_for_roles(
+    profile_id: int,
+    roles: List[str],
+    limit: int = 100,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Snapshots for several roles in one query; same per-role result as
+    get_snapshots_for_profile(profile_id, target_role=role, limit)."""
+    result: Dict[str, List[Dict[str, Any]]] = {role: [] for role in roles}
+    if not result:
+        return result
+    roles = list(result)
+    con = _conn()
+    # The requested names join on the same normalised index as the single-role
+    # query; ROW_NUMBER keeps the per-role LIMIT.
+    rows = con.execute(
+        f"""WITH req(role) AS (VALUES {",".join(["(?)"] * len(roles))})
+            SELECT * FROM (
+                SELECT req.role AS req_role, s.*,
+                       ROW_NUMBER() OVER (PARTITION BY req.role
+                                          ORDER BY s.saved_at ASC) AS req_rank
+                FROM req
+                JOIN score_snapshots s
+                  ON s.profile_id=? AND s.target_role_norm=lower(trim(req.role))
+            )
+            WHERE req_rank <= ?
+            ORDER BY req_role, saved_at ASC""",
+        (*roles, profile_id, limit),
+    ).fetchall()
+    con.close()
     for r in rows:
-        d = dict(r)
-        for f in ("matched_skills", "missing_skills"):
-            try:
-                d[f] = json.loads(d[f]) if d[f] else []
-            except Exception:
-                d[f] = []
-        result.append(d)
+        snap = _decode_snapshot(r)
+        role = snap.pop("req_role")
+        del snap["req_rank"]
+        result[role].append(snap)
     return result
 
 
 def get_distinct_roles(profile_id: int) -> List[str]:
+    with _cache_lock:
+        entry = _roles_cache.get(profile_id)
+    if entry and time.monotonic() - entry[0] < _CACHE_TTL:
+        return list(entry[1])
     con = _conn()
+    # One entry per normalized role, since every role lookup matches on
+    # target_role_norm; spelling variants would otherwise repeat the same rows
     rows = con.execute(
-        "SELECT DISTINCT target_role FROM score_snapshots WHERE profile_id=? ORDER BY target_role",
+        """SELECT MIN(target_role) AS target_role FROM score_snapshots
+           WHERE profile_id=? GROUP BY target_role_norm ORDER BY 1""",
         (profile_id,),
     ).fetchall()
     con.close()
-    return [r["target_role"] for r in rows]
+    roles = [r["target_role"] for r in rows]
+    with _cache_lock:
+        _roles_cache[profile_id] = (time.monotonic(), roles)
+    return list(roles)
 
 
 def delete_snapshot(snapshot_id: int) -> None:
     con = _conn()
-    with con:
-        con.execute("DELETE FROM score_snapshots WHERE id=?", (snapshot_id,))
+    con.execute("DELETE FROM score_snapshots WHERE id=?", (snapshot_id,))
     con.close()
+    _invalidate_roles()
 
 
 def clear_snapshots_for_profile(profile_id: int) -> int:
     con = _conn()
-    with con:
+    with _write_tx(con):
         cur = con.execute(
             "DELETE FROM score_snapshots WHERE profile_id=?", (profile_id,)
         )
         n = cur.rowcount
     con.close()
+    _invalidate_roles(profile_id)
     return n
 
 
 def get_before_after(profile_id: int, target_role: str) -> Dict[str, Any]:
     con = _conn()
+    # Two index seeks on (profile_id, target_role_norm, saved_at): oldest, then newest.
     rows = con.execute(
-        """SELECT * FROM score_snapshots
-           WHERE profile_id=? AND target_role=?
-           ORDER BY saved_at ASC""",
-        (profile_id, target_role.strip()),
+        """SELECT * FROM (SELECT * FROM score_snapshots
+                          WHERE profile_id=? AND target_role_norm=lower(trim(?))
+                          ORDER BY saved_at ASC, id ASC LIMIT 1)
+           UNION ALL
+           SELECT * FROM (SELECT * FROM score_snapshots
+                          WHERE profile_id=? AND target_role_norm=lower(trim(?))
+                          ORDER BY saved_at DESC, id DESC LIMIT 1)""",
+        (profile_id, target_role, profile_id, target_role),
     ).fetchall()
     con.close()
     if not rows:
         return {"first": None, "latest": None, "delta": 0.0}
-    first  = dict(rows[0])
-    latest = dict(rows[-1])
-    for snap in (first, latest):
-        for f in ("matched_skills", "missing_skills"):
-            try:
-                snap[f] = json.loads(snap[f]) if snap[f] else []
-            except Exception:
-                snap[f] = []
+    first  = _decode_snapshot(rows[0])
+    latest = _decode_snapshot(rows[-1])
     return {
         "first": first,
         "latest": latest,
@@ -243,17 +366,40 @@ def get_before_after(profile_id: int, target_role: str) -> Dict[str, Any]:
 
 # ── Skill-level progress ──────────────────────────────────────────────────────
 
+def _utc_now() -> str:
+    """Timestamp in the same 'YYYY-MM-DD HH:MM:SS' UTC form as datetime('now')."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+
+_UPSERT_SKILL_SQL = """INSERT INTO skill_progress (profile_id, skill_name, status, updated_at)
+           VALUES (?,?,?,?)
+           ON CONFLICT(profile_id, skill_name)
+           DO UPDATE SET status=excluded.status,
+                         updated_at=excluded.updated_at"""
+
+
 def upsert_skill_status(profile_id: int, skill_name: str, status: str) -> None:
     con = _conn()
-    with con:
-        con.execute(
-            """INSERT INTO skill_progress (profile_id, skill_name, status, updated_at)
-               VALUES (?,?,?,datetime('now'))
-               ON CONFLICT(profile_id, skill_name)
-               DO UPDATE SET status=excluded.status,
-                             updated_at=excluded.updated_at""",
-            (profile_id, skill_name.strip().lower(), status),
-        )
+    con.execute(
+        _UPSERT_SKILL_SQL,
+        (profile_id, skill_name.strip().lower(), status, _utc_now()),
+    )
+    con.close()
+
+
+def upsert_skill_statuses_bulk(
+    profile_id: int,
+    items: Iterable[Tuple[str, str]],
+) -> None:
+    """Upsert many (skill_name, status) pairs in one transaction; later pairs
+    win for the same skill, as with repeated upsert_skill_status calls."""
+    now = _utc_now()
+    rows = [(profile_id, name.strip().lower(), status, now) for name, status in items]
+    if not rows:
+        return
+    con = _conn()
+    with _write_tx(con):
+        con.executemany(_UPSERT_SKILL_SQL, rows)
     con.close()
 
 
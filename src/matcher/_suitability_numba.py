@@ -0,0 +1,84 @@
+"""
+Numeric kernel for RoleSuitabilityPredictor.
+
+Classifies every role in one pass over flat arrays and returns integer
+bucket codes; the predictor turns codes into reason strings. The loop kernel is
+compiled with numba when it is installed, otherwise an equivalent NumPy
+implementation is used.
+"""
+
+from typing import Tuple
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _classify_numpy(
+    scores: np.ndarray,
+    n_missing_req: np.ndarray,
+    match_pct: np.ndarray,
+    threshold: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized fallback with the same semantics as ``_classify_loop``."""
+    suitable = scores >= threshold
+
+    score_bucket = np.where(
+        suitable,
+        np.where(scores >= 80, 2, np.where(scores >= 65, 1, 0)),
+        np.where(scores < 35, 0, 1),
+    ).astype(np.int8)
+    gap_bucket = np.where(
+        n_missing_req == 0, 0, np.where(n_missing_req <= 2, 1, 2)
+    ).astype(np.int8)
+    match_bucket = np.where(
+        suitable,
+        np.where(match_pct >= 80, 2, np.where(match_pct >= 60, 1, 0)),
+        np.where(match_pct < 50, 1, 0),
+    ).astype(np.int8)
+
+    return suitable.astype(np.int8), score_bucket, gap_bucket, match_bucket
+
+
+def _classify_loop(scores, n_missing_req, match_pct, threshold):
+    """
+    Per-role classification loop (numba target).
+
+    Returns (suitable, score_bucket, gap_bucket, match_bucket):
+    - suitable: 1 if score >= threshold
+    - score_bucket: suitable 2/1/0 = >=80 / >=65 / other;
+      unsuitable 0/1 = <35 / other
+    - gap_bucket: 0 = none missing, 1 = 1-2 missing, 2 = 3+ missing
+    - match_bucket: suitable 2/1/0 = >=80 / >=60 / other;
+      unsuitable 1 = below 50%
+    """
+    n = scores.shape[0]
+    suitable = np.zeros(n, dtype=np.int8)
+    score_bucket = np.zeros(n, dtype=np.int8)
+    gap_bucket = np.zeros(n, dtype=np.int8)
+    match_bucket = np.zeros(n, dtype=np.int8)
+
+    for i in range(n):
+        score = scores[i]
+        pct = match_pct[i]
+        if score >= threshold:
+            suitable[i] = 1
+            score_bucket[i] = 2 if score >= 80 else (1 if score >= 65 else 0)
+            match_bucket[i] = 2 if pct >= 80 else (1 if pct >= 60 else 0)
+        else:
+            score_bucket[i] = 0 if score < 35 else 1
+            match_bucket[i] = 1 if pct < 50 else 0
+
+        missing = n_missing_req[i]
+        gap_bucket[i] = 0 if missing == 0 else (1 if missing <= 2 else 2)
+
+    return suitable, score_bucket, gap_bucket, match_bucket
+
+
+if NUMBA_AVAILABLE:
+    classify = njit(cache=True)(_classify_loop)
+else:
+    classify = _classify_numpy
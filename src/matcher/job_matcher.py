@@ -1,26 +1,96 @@
 """Job matcher - matches resume to multiple job roles."""
 
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
+import numpy as np
 from src.models.resume import Resume
 from src.models.job_role import JobRole
 from src.core.score_calculator import ScoreCalculator
 from src.core.skill_matcher import SkillMatcher
+from src.utils.text_processor import normalize_skill_name
 
 
 class JobMatcher:
     """Match resume to multiple job roles and rank them."""
-    
+
     def __init__(self, config: Dict = None):
         """
         Initialize job matcher.
-        
+
         Args:
             config: Configuration dictionary
         """
         self.config = config or {}
         self.score_calculator = ScoreCalculator(config)
         self.skill_matcher = SkillMatcher()
-    
+
+        # Role x skill index, rebuilt only when a different role list is passed
+        self._indexed_roles: Optional[List[JobRole]] = None
+        self._skill_names: List[str] = []
+        self._required_ids: List[List[int]] = []
+        self._preferred_ids: List[List[int]] = []
+        self._required_mat = np.zeros((0, 0), dtype=np.uint8)
+        self._preferred_mat = np.zeros((0, 0), dtype=np.uint8)
+        self._required_totals = np.zeros(0, dtype=np.float64)
+        self._preferred_totals = np.zeros(0, dtype=np.float64)
+
+    def _build_skill_index(self, job_roles: List[JobRole]) -> None:
+        """
+        Build the role x skill incidence matrices for a list of job roles.
+
+        Every distinct normalized skill gets an integer id. Row k of
+        ``_required_mat`` / ``_preferred_mat`` counts how often each skill
+        id appears in role k's required / preferred list, so a product with
+        a resume's 0/1 skill vector gives the matched count per role.
+        """
+        skill_to_id: Dict[str, int] = {}
+        self._required_ids = []
+        self._preferred_ids = []
+
+        for job_role in job_roles:
+            skill_arrays = job_role.get_skill_arrays()
+            self._required_ids.append([
+                skill_to_id.setdefault(name, len(skill_to_id))
+                for name in skill_arrays.required_normalized
+            ])
+            self._preferred_ids.append([
+                skill_to_id.setdefault(name, len(skill_to_id))
+                for name in skill_arrays.preferred_normalized
+            ])
+
+        n_roles, n_skills = len(job_roles), len(skill_to_id)
+        self._skill_names = list(skill_to_id)
+        self._required_mat = np.zeros((n_roles, n_skills), dtype=np.uint8)
+        self._preferred_mat = np.zeros((n_roles, n_skills), dtype=np.uint8)
+        for k, (req_ids, pref_ids) in enumerate(zip(self._required_ids, self._preferred_ids)):
+            np.add.at(self._required_mat[k], req_ids, 1)
+            np.add.at(self._preferred_mat[k], pref_ids, 1)
+
+        self._required_totals = np.array([len(ids) for ids in self._required_ids], dtype=np.float64)
+        self._preferred_totals = np.array([len(ids) for ids in self._preferred_ids], dtype=np.float64)
+        self._indexed_roles = list(job_roles)
+
+    def _ensure_skill_index(self, job_roles: List[JobRole]) -> None:
+        """Rebuild the skill index if ``job_roles`` differs from the indexed list."""
+        indexed = self._indexed_roles
+        if (
+            indexed is None
+            or len(indexed) != len(job_roles)
+            or any(a is not b for a, b in zip(indexed, job_roles))
+        ):
+            self._build_skill_index(job_roles)
+
+    def _resume_vector(self, resume_skills: List[str]) -> np.ndarray:
+        """Mark every indexed skill that the resume covers (exact or fuzzy)."""
+        resume_skills_normalized = {normalize_skill_name(s): s for s in resume_skills}
+        return np.fromiter(
+            (
+                self.skill_matcher.has_match(name, resume_skills_normalized)
+                for name in self._skill_names
+            ),
+            dtype=np.uint8,
+            count=len(self._skill_names),
+        )
+
     def match_roles(
         self,
         resume: Resume,
@@ -29,45 +99,172 @@ class JobMatcher:
     ) -> List[Dict]:
         """
         Match resume to multiple job roles and return ranked results.
-        
+
         Args:
             resume: Resume object
             job_roles: List of job roles to match against
             top_n: Number of top matches to return
-            
+
         Returns:
             List of match results, sorted by score (highest first)
             Each result contains: role_name, score, breakdown, details
         """
-        results = []
-        resume_skills = resume.get_all_skills()
-        
-        for job_role in job_roles:
-            # Match skills
-            skill_match_result = self.skill_matcher.match_skills(resume_skills, job_role)
-            
-            # Calculate score
-            score_result = self.score_calculator.calculate_score(
-                resume, job_role, skill_match_result
+        return self.match_roles_batch([resume], job_roles, top_n)[0]
+
+    def match_roles_batch(
+        self,
+        resumes: List[Resume],
+        job_roles: List[JobRole],
+        top_n: int = 5
+    ) -> List[List[Dict]]:
+        """
+        Match many resumes against the same job roles in one pass.
+
+        The resume skill vectors are stacked into an (N, S) matrix so the
+        matched-skill counts for every resume/role pair come from a single
+        matrix product per skill category.
+
+        Args:
+            resumes: Resume objects to rank roles for
+            job_roles: List of job roles to match against
+            top_n: Number of top matches to return per resume
+
+        Returns:
+            One list per resume, in the same shape as match_roles()
+        """
+        if not job_roles:
+            return [[] for _ in resumes]
+        if not resumes:
+            return []
+
+        self._ensure_skill_index(job_roles)
+        resume_mat = np.stack([self._resume_vector(r.get_all_skills()) for r in resumes])
+
+        # (N, K) matched skill counts for every resume/role pair
+        matched_req = np.matmul(resume_mat, self._required_mat.T, dtype=np.int32)
+        matched_pref = np.matmul(resume_mat, self._preferred_mat.T, dtype=np.int32)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            required_scores = np.where(
+                self._required_totals == 0, 100.0, matched_req / self._required_totals * 100.0
+            )
+            preferred_scores = np.where(
+                self._preferred_totals == 0, 100.0, matched_pref / self._preferred_totals * 100.0
             )
-            
-            results.append({
-                'role_name': job_role.name,
-                'role_description': job_role.description,
-                'score': score_result['overall_score'],
-                'breakdown': score_result['breakdown'],
-                'skill_match': skill_match_result,
-                'job_role': job_role,  # Include full role for further processing
-            })
-        
-        # Sort by score (descending)
-        results.sort(key=lambda x: x['score'], reverse=True)
-        
-        # Return top N
-        return results[:top_n]
-    
+
+        batch_results = []
+        for n, resume in enumerate(resumes):
+            overall_scores, component_scores = self._overall_scores(
+                resume, job_roles, required_scores[n], preferred_scores[n]
+            )
+            top_idx = self._top_indices(overall_scores, top_n)
+
+            # Only the returned roles are materialized into result dicts
+            batch_results.append([
+                self._build_result(
+                    job_roles[k], k, resume_mat[n], float(overall_scores[k]), component_scores[k]
+                )
+                for k in top_idx
+            ])
+        return batch_results
+
+    def _overall_scores(
+        self,
+        resume: Resume,
+        job_roles: List[JobRole],
+        required_scores: np.ndarray,
+        preferred_scores: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Combine skill scores with the per-role non-skill components.
+
+        Returns the overall score per role and a preallocated (K, 5) array of
+        component scores in breakdown order; result dicts are only built later
+        for the top-N roles.
+        """
+        calc = self.score_calculator
+        n_roles = len(job_roles)
+        component_scores = np.empty((n_roles, 5), dtype=np.float64)
+        component_scores[:, 0] = required_scores
+        component_scores[:, 1] = preferred_scores
+
+        # Non-skill components depend on resume/role fields, not on the skill index
+        for k, job_role in enumerate(job_roles):
+            component_scores[k, 2:] = calc.calculate_non_skill_scores(resume, job_role)
+
+        # Same weighting and clamping as ScoreCalculator.calculate_score
+        overall = calc.calculate_overall_score(*component_scores.T)
+        overall_scores = np.empty(n_roles, dtype=np.float64)
+        for k, score in enumerate(overall.tolist()):
+            overall_scores[k] = round(score, 2)
+        return overall_scores, component_scores
+
+    @staticmethod
+    def _top_indices(scores: np.ndarray, top_n: int) -> np.ndarray:
+        """
+        Indices of the ``top_n`` highest scores, highest first.
+
+        Equal scores keep their input order, exactly like a stable sort
+        followed by ``[:top_n]``, but only the candidates at or above the
+        ``top_n``-th largest score (found with ``np.partition``) get sorted.
+        """
+        if top_n <= 0 or top_n >= len(scores):
+            return np.argsort(-scores, kind='stable')[:top_n]
+
+        cutoff = np.partition(scores, len(scores) - top_n)[len(scores) - top_n]
+        candidates = np.flatnonzero(scores >= cutoff)
+        order = np.argsort(-scores[candidates], kind='stable')
+        return candidates[order[:top_n]]
+
+    def _build_result(
+        self,
+        job_role: JobRole,
+        k: int,
+        resume_vec: np.ndarray,
+        overall_score: float,
+        components: np.ndarray
+    ) -> Dict:
+        """Assemble the public result dict for role ``k``."""
+        matched_required, missing_required = [], []
+        for req, skill_id in zip(job_role.required_skills, self._required_ids[k]):
+            if resume_vec[skill_id]:
+                matched_required.append(req.skill)
+            else:
+                missing_required.append(req)
+
+        matched_preferred, missing_preferred = [], []
+        for req, skill_id in zip(job_role.preferred_skills, self._preferred_ids[k]):
+            if resume_vec[skill_id]:
+                matched_preferred.append(req.skill)
+            else:
+                missing_preferred.append(req)
+
+        skill_match_result = {
+            'matched_required': matched_required,
+            'matched_preferred': matched_preferred,
+            'missing_required': missing_required,
+            'missing_preferred': missing_preferred,
+            'match_ratio_required': len(matched_required) / max(len(job_role.required_skills), 1),
+            'match_ratio_preferred': len(matched_preferred) / max(len(job_role.preferred_skills), 1),
+        }
+
+        components = components.tolist()
+        return {
+            'role_name': job_role.name,
+            'role_description': job_role.description,
+            'score': overall_score,
+            'breakdown': {
+                'required_skills': round(components[0], 2),
+                'preferred_skills': round(components[1], 2),
+                'experience': round(components[2], 2),
+                'education': round(components[3], 2),
+                'certifications': round(components[4], 2),
+            },
+            'skill_match': skill_match_result,
+            'job_role': job_role,  # Include full role for further processing
+        }
+
     def get_best_match(self, resume: Resume, job_roles: List[JobRole]) -> Dict:
         """Get the best matching job role."""
         matches = self.match_roles(resume, job_roles, top_n=1)
         return matches[0] if matches else None
-
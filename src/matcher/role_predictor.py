@@ -1,18 +1,92 @@
 """Role predictor - predicts suitable job roles based on skills."""
 
-from typing import List, Dict
+from typing import List, Optional
+import numpy as np
 from src.models.resume import Resume
 from src.models.job_role import JobRole
 from src.core.skill_matcher import SkillMatcher
 
 
+def _pack_bits(rows: np.ndarray) -> np.ndarray:
+    """Pack 0/1 rows into ``uint64`` words (zero-padded to whole words)."""
+    packed = np.packbits(rows, axis=-1)
+    pad = -packed.shape[-1] % 8
+    if pad:
+        packed = np.pad(packed, [(0, 0)] * (packed.ndim - 1) + [(0, pad)])
+    return np.ascontiguousarray(packed).view(np.uint64)
+
+
+if hasattr(np, 'bitwise_count'):  # NumPy >= 2.0
+    def _popcount_rows(words: np.ndarray) -> np.ndarray:
+        """Number of set bits in each row of a ``uint64`` word matrix."""
+        return np.bitwise_count(words).sum(axis=-1, dtype=np.int32)
+else:
+    def _popcount_rows(words: np.ndarray) -> np.ndarray:
+        """Number of set bits in each row of a ``uint64`` word matrix."""
+        return np.unpackbits(words.view(np.uint8), axis=-1).sum(axis=-1, dtype=np.int32)
+
+
 class RolePredictor:
     """Predict suitable job roles based on resume skills."""
-    
+
     def __init__(self):
         """Initialize role predictor."""
         self.skill_matcher = SkillMatcher()
-    
+
+        # Role skill sets as bitsets built by fit(); bit i is skill vocabulary id i
+        self._fitted_roles: Optional[List[JobRole]] = None
+        self._role_names: List[str] = []
+        self._n_skills = 0
+        self._role_bits = np.zeros((0, 0), dtype=np.uint64)
+        self._role_sizes = np.zeros(0, dtype=np.float64)
+
+    def fit(self, all_job_roles: List[JobRole]) -> "RolePredictor":
+        """
+        Precompute the role skill bitsets for a list of job roles.
+
+        Each role becomes a row of ``uint64`` words, so the overlap with a
+        resume is a vectorized AND plus popcount over all roles at once.
+
+        Roles without any skills are left out, as they can never be predicted.
+
+        Args:
+            all_job_roles: All available job roles
+
+        Returns:
+            self
+        """
+        role_names = []
+        role_skill_ids = []
+
+        for job_role in all_job_roles:
+            skill_ids = job_role.get_skill_ids()
+            if not len(skill_ids):
+                continue
+            role_names.append(job_role.name)
+            role_skill_ids.append(skill_ids)
+
+        n_skills = max((int(ids.max()) + 1 for ids in role_skill_ids), default=0)
+        role_mat = np.zeros((len(role_names), n_skills), dtype=np.uint8)
+        for k, ids in enumerate(role_skill_ids):
+            role_mat[k, ids] = 1
+
+        self._role_names = role_names
+        self._n_skills = n_skills
+        self._role_bits = _pack_bits(role_mat)
+        self._role_sizes = np.array([len(ids) for ids in role_skill_ids], dtype=np.float64)
+        self._fitted_roles = list(all_job_roles)
+        return self
+
+    def _ensure_fitted(self, all_job_roles: List[JobRole]) -> None:
+        """Refit if ``all_job_roles`` differs from the fitted role list."""
+        fitted = self._fitted_roles
+        if (
+            fitted is None
+            or len(fitted) != len(all_job_roles)
+            or any(a is not b for a, b in zip(fitted, all_job_roles))
+        ):
+            self.fit(all_job_roles)
+
     def predict_roles(
         self,
         resume: Resume,
@@ -21,48 +95,33 @@ class RolePredictor:
     ) -> List[str]:
         """
         Predict suitable job roles based on skills.
-        
+
         This is a simple implementation based on skill overlap.
         Can be enhanced with ML models if needed.
-        
+
         Args:
             resume: Resume object
             all_job_roles: All available job roles
             top_n: Number of predictions to return
-            
+
         Returns:
             List of predicted role names (sorted by suitability)
         """
-        resume_skills = set(resume.get_all_skills())
-        role_scores = []
-        
-        for job_role in all_job_roles:
-            # Calculate skill overlap
-            role_skills = set(job_role.get_all_skills())
-            
-            if not role_skills:
-                continue
-            
-            # Calculate overlap ratio
-            overlap = resume_skills.intersection(role_skills)
-            overlap_ratio = len(overlap) / len(role_skills)
-            
-            # Also consider total number of matched skills
-            matched_count = len(overlap)
-            
-            # Combined score (weighted)
-            score = overlap_ratio * 0.7 + (min(matched_count / 10, 1.0) * 0.3)
-            
-            role_scores.append({
-                'role_name': job_role.name,
-                'score': score,
-                'matched_skills_count': matched_count,
-                'overlap_ratio': overlap_ratio,
-            })
-        
-        # Sort by score
-        role_scores.sort(key=lambda x: x['score'], reverse=True)
-        
-        # Return top N role names
-        return [r['role_name'] for r in role_scores[:top_n]]
+        self._ensure_fitted(all_job_roles)
+        if not self._role_names:
+            return []
+
+        # Ids beyond the bitset width belong to skills no fitted role uses
+        n_skills = self._n_skills
+        resume_ids = resume.get_skill_ids()
+        resume_vec = np.zeros(n_skills, dtype=np.uint8)
+        resume_vec[resume_ids[resume_ids < n_skills]] = 1
+        resume_bits = _pack_bits(resume_vec)
+
+        # Overlap ratio plus a capped bonus for the total number of matched skills
+        matched = _popcount_rows(self._role_bits & resume_bits)
+        scores = (matched / self._role_sizes) * 0.7 + np.minimum(matched / 10, 1.0) * 0.3
 
+        # Stable descending order keeps input order among equal scores
+        top_idx = np.argsort(-scores, kind='stable')[:top_n]
+        return [self._role_names[i] for i in top_idx]
@@ -4,8 +4,18 @@ Role Suitability Predictor
 Predicts best-fit roles and identifies not suitable roles with reasons.
 """
 
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import List, Dict, Optional, Union
+import numpy as np
 from src.models.job_role import JobRole
+from src.models.analysis_result import SkillGapResult
+from src.matcher._suitability_numba import classify
+
+
+@lru_cache(maxsize=1024)
+def _format_reason(template: str, value: float) -> str:
+    """Format a ``%.1f`` reason template (scores repeat a lot across roles)."""
+    return template % value
 
 
 class RoleSuitabilityPredictor:
@@ -17,6 +27,29 @@ class RoleSuitabilityPredictor:
     - Not suitable roles with specific reasons
     """
     
+    # Missing any trigger skill adds the paired reason for an unsuitable role
+    _CRITICAL_REASONS = [
+        (frozenset({"Deep Learning", "TensorFlow"}), "Lacks deployment and advanced ML experience"),
+        (frozenset({"Statistics"}), "Missing statistical foundations"),
+        (frozenset({"AWS", "Docker"}), "Lacks cloud/deployment experience"),
+    ]
+    
+    # Readiness reason templates indexed by score bucket
+    _SUITABLE_SCORE_REASONS = (
+        "Moderate readiness score (%.1f/100)",
+        "Good readiness score (%.1f/100)",
+        "Excellent readiness score (%.1f/100)",
+    )
+    _UNSUITABLE_SCORE_REASONS = (
+        "Very low readiness score (%.1f/100)",
+        "Below threshold readiness score (%.1f/100)",
+    )
+    _SUITABLE_MATCH_REASONS = (
+        None,
+        "Good skill match (%.1f%% of required skills)",
+        "Strong skill match (%.1f%% of required skills)",
+    )
+    
     def __init__(self, suitability_threshold: float = 50.0):
         """
         Initialize role suitability predictor.
@@ -29,8 +62,10 @@ class RoleSuitabilityPredictor:
     def predict_suitability(
         self,
         readiness_scores: Dict[str, float],
-        skill_gaps: Dict[str, Dict],
-        role_descriptions: Optional[Dict[str, str]] = None
+        skill_gaps: Dict[str, Union[Dict, SkillGapResult]],
+        role_descriptions: Optional[Dict[str, str]] = None,
+        max_best_fit: Optional[int] = None,
+        max_not_suitable: Optional[int] = None
     ) -> Dict:
         """
         Predict role suitability based on readiness scores and skill gaps.
@@ -38,7 +73,10 @@ class RoleSuitabilityPredictor:
         Args:
             readiness_scores: Dictionary mapping role names to readiness scores (0-100)
             skill_gaps: Dictionary mapping role names to skill gap analysis results
+                (analysis dicts or SkillGapResult objects)
             role_descriptions: Optional dictionary of role descriptions
+            max_best_fit: Return at most this many suitable roles (None = all)
+            max_not_suitable: Return at most this many unsuitable roles (None = all)
             
         Returns:
             Dictionary with:
@@ -46,9 +84,6 @@ class RoleSuitabilityPredictor:
             - not_suitable_roles: List of roles with reasons
             - recommendations: Overall recommendations
         """
-        best_fit_roles = []
-        not_suitable_roles = []
-        
         # Sort roles by readiness score
         sorted_roles = sorted(
             readiness_scores.items(),
@@ -56,35 +91,44 @@ class RoleSuitabilityPredictor:
             reverse=True
         )
         
-        for role_name, score in sorted_roles:
-            gap_info = skill_gaps.get(role_name, {})
-            missing_required = gap_info.get('missing_required', [])
-            missing_preferred = gap_info.get('missing_preferred', [])
-            match_details = gap_info.get('match_details', {})
-            
-            # Determine suitability
-            if score >= self.suitability_threshold:
-                # Suitable role
-                reasons = self._generate_suitability_reasons(
-                    role_name, score, missing_required, missing_preferred, match_details
-                )
-                best_fit_roles.append({
-                    'role_name': role_name,
-                    'readiness_score': score,
-                    'reasons': reasons,
-                    'description': role_descriptions.get(role_name, '') if role_descriptions else ''
-                })
-            else:
-                # Not suitable - generate reasons
-                reasons = self._generate_unsuitability_reasons(
-                    role_name, score, missing_required, missing_preferred, match_details
-                )
-                not_suitable_roles.append({
-                    'role_name': role_name,
-                    'readiness_score': score,
-                    'reasons': reasons,
-                    'description': role_descriptions.get(role_name, '') if role_descriptions else ''
-                })
+        # Gather the numeric inputs for every role in one pass
+        gaps = [
+            SkillGapResult.from_gap_info(skill_gaps.get(role_name, {}))
+            for role_name, _ in sorted_roles
+        ]
+        
+        scores_np = np.array([score for _, score in sorted_roles], dtype=np.float64)
+        n_missing_np = np.array([len(g.missing_required) for g in gaps], dtype=np.int32)
+        match_pct_np = np.array([g.match_percentage for g in gaps], dtype=np.float64)
+        
+        # Classify all roles at once; only string formatting stays per role
+        suitable, score_bucket, gap_bucket, match_bucket = classify(
+            scores_np, n_missing_np, match_pct_np, float(self.suitability_threshold)
+        )
+        
+        # Loop-invariant: resolve the optional descriptions mapping once
+        get_description = role_descriptions.get if role_descriptions else (lambda _name, _default='': '')
+        
+        def format_role(i: int, reason_fn) -> Dict:
+            role_name, score = sorted_roles[i]
+            return {
+                'role_name': role_name,
+                'readiness_score': score,
+                'reasons': reason_fn(
+                    score, gaps[i], score_bucket[i], gap_bucket[i], match_bucket[i]
+                ),
+                'description': get_description(role_name, '')
+            }
+        
+        # Partition once, then format reasons only for the roles that are returned
+        best_idx = np.flatnonzero(suitable)[:max_best_fit]
+        not_suitable_idx = np.flatnonzero(suitable == 0)[:max_not_suitable]
+        best_fit_roles = [
+            format_role(i, self._generate_suitability_reasons) for i in best_idx
+        ]
+        not_suitable_roles = [
+            format_role(i, self._generate_unsuitability_reasons) for i in not_suitable_idx
+        ]
         
         # Generate overall recommendations
         recommendations = self._generate_recommendations(best_fit_roles, not_suitable_roles)
@@ -97,80 +141,64 @@ class RoleSuitabilityPredictor:
     
     def _generate_suitability_reasons(
         self,
-        role_name: str,
         score: float,
-        missing_required: List[str],
-        missing_preferred: List[str],
-        match_details: Dict
+        gap: SkillGapResult,
+        score_bucket: int,
+        gap_bucket: int,
+        match_bucket: int
     ) -> List[str]:
-        """Generate reasons why a role is suitable."""
-        reasons = []
-        
-        if score >= 80:
-            reasons.append(f"Excellent readiness score ({score:.1f}/100)")
-        elif score >= 65:
-            reasons.append(f"Good readiness score ({score:.1f}/100)")
-        else:
-            reasons.append(f"Moderate readiness score ({score:.1f}/100)")
+        """Generate reasons why a role is suitable from classification codes."""
+        reasons = [_format_reason(self._SUITABLE_SCORE_REASONS[score_bucket], score)]
         
-        match_pct = match_details.get('match_percentage', 0)
-        if match_pct >= 80:
-            reasons.append(f"Strong skill match ({match_pct:.1f}% of required skills)")
-        elif match_pct >= 60:
-            reasons.append(f"Good skill match ({match_pct:.1f}% of required skills)")
+        if match_bucket:
+            reasons.append(
+                _format_reason(self._SUITABLE_MATCH_REASONS[match_bucket], gap.match_percentage)
+            )
         
-        if not missing_required:
+        if gap_bucket == 0:
             reasons.append("All required skills are present")
-        elif len(missing_required) <= 2:
-            reasons.append(f"Only {len(missing_required)} required skill(s) missing")
+        elif gap_bucket == 1:
+            reasons.append(f"Only {len(gap.missing_required)} required skill(s) missing")
         
-        matched_count = match_details.get('matched_count', 0)
-        if matched_count > 0:
-            reasons.append(f"{matched_count} skills matched successfully")
+        if gap.matched_count > 0:
+            reasons.append(f"{gap.matched_count} skills matched successfully")
         
         return reasons
     
     def _generate_unsuitability_reasons(
         self,
-        role_name: str,
         score: float,
-        missing_required: List[str],
-        missing_preferred: List[str],
-        match_details: Dict
+        gap: SkillGapResult,
+        score_bucket: int,
+        gap_bucket: int,
+        match_bucket: int
     ) -> List[str]:
-        """Generate reasons why a role is not suitable."""
-        reasons = []
+        """Generate reasons why a role is not suitable from classification codes."""
+        missing_required = gap.missing_required
         
         # Score-based reasons
-        if score < 35:
-            reasons.append(f"Very low readiness score ({score:.1f}/100)")
-        else:
-            reasons.append(f"Below threshold readiness score ({score:.1f}/100)")
+        reasons = [_format_reason(self._UNSUITABLE_SCORE_REASONS[score_bucket], score)]
         
         # Missing required skills
-        if missing_required:
-            if len(missing_required) >= 3:
-                reasons.append(f"Missing {len(missing_required)} critical required skills")
-                # List top 3 missing skills
-                top_missing = missing_required[:3]
-                reasons.append(f"Critical gaps: {', '.join(top_missing)}")
-            else:
-                reasons.append(f"Missing required skills: {', '.join(missing_required)}")
+        if gap_bucket == 2:
+            reasons.append(f"Missing {len(missing_required)} critical required skills")
+            # List top 3 missing skills
+            reasons.append(f"Critical gaps: {', '.join(missing_required[:3])}")
+        elif gap_bucket == 1:
+            reasons.append(f"Missing required skills: {', '.join(missing_required)}")
         
         # Low skill match
-        match_pct = match_details.get('match_percentage', 0)
-        if match_pct < 50:
-            reasons.append(f"Low skill match ({match_pct:.1f}% of required skills)")
+        if match_bucket:
+            reasons.append(
+                _format_reason("Low skill match (%.1f%% of required skills)", gap.match_percentage)
+            )
         
         # Specific skill gaps
-        if "Deep Learning" in missing_required or "TensorFlow" in missing_required:
-            reasons.append("Lacks deployment and advanced ML experience")
-        
-        if "Statistics" in missing_required:
-            reasons.append("Missing statistical foundations")
-        
-        if "AWS" in missing_required or "Docker" in missing_required:
-            reasons.append("Lacks cloud/deployment experience")
+        if missing_required:
+            missing_set = frozenset(s for s in missing_required if isinstance(s, str))
+            for trigger, message in self._CRITICAL_REASONS:
+                if trigger & missing_set:
+                    reasons.append(message)
         
         # Generic reason if none specific
         if len(reasons) == 1:  # Only score reason
@@ -1,16 +1,21 @@
 """Data models for the career analyzer."""
 
 from .resume import Resume, ResumeSection
-from .job_role import JobRole, SkillRequirement
-from .analysis_result import AnalysisResult, RoleScore, SkillGap
+from .job_role import JobRole, SkillRequirement, SkillArrays
+from .analysis_result import AnalysisResult, RoleScore, SkillGap, SkillGapResult
+from .skill_vocabulary import SkillVocabulary, SKILL_VOCABULARY
 
 __all__ = [
     "Resume",
     "ResumeSection",
     "JobRole",
     "SkillRequirement",
+    "SkillArrays",
     "AnalysisResult",
     "RoleScore",
     "SkillGap",
+    "SkillGapResult",
+    "SkillVocabulary",
+    "SKILL_VOCABULARY",
 ]
 
@@ -1,10 +1,12 @@
 """Analysis result data models."""
 
+import sys
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Sequence, Tuple, Union
+import orjson
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillGap:
     """Represents a missing skill with details."""
     skill: str
@@ -13,8 +15,36 @@ class SkillGap:
     description: Optional[str] = None
     learning_resources: List[str] = field(default_factory=list)
 
+    def __post_init__(self):
+        # Categories loaded from JSON/DB are fresh strings; interning them lets
+        # category comparisons hit the identity fast path
+        if type(self.category) is str:
+            self.category = sys.intern(self.category)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
+class SkillGapResult:
+    """Compact per-role gap summary consumed by RoleSuitabilityPredictor."""
+    missing_required: Tuple[str, ...] = ()
+    missing_preferred: Tuple[str, ...] = ()
+    match_percentage: float = 0.0
+    matched_count: int = 0
+    
+    @classmethod
+    def from_gap_info(cls, gap_info: Union["SkillGapResult", Dict]) -> "SkillGapResult":
+        """Build from a skill gap analysis dict (returned unchanged if already converted)."""
+        if isinstance(gap_info, cls):
+            return gap_info
+        match_details = gap_info.get('match_details', {})
+        return cls(
+            missing_required=tuple(gap_info.get('missing_required', ())),
+            missing_preferred=tuple(gap_info.get('missing_preferred', ())),
+            match_percentage=match_details.get('match_percentage', 0),
+            matched_count=match_details.get('matched_count', 0),
+        )
+
+
+@dataclass(slots=True)
 class RoleScore:
     """Score breakdown for a specific job role."""
     role_name: str
@@ -28,17 +58,17 @@ class RoleScore:
     skill_score: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class LearningPath:
     """A learning path for skill improvement."""
     skill: str
     priority: int  # 1 = highest priority
     estimated_days: int
     resources: List[str]  # URLs, course names, etc.
-    prerequisites: List[str] = field(default_factory=list)
+    prerequisites: Sequence[str] = field(default_factory=list)  # may be a shared tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """Complete analysis result for a resume."""
     
@@ -73,8 +103,18 @@ class AnalysisResult:
             return self.scores[role_name].overall_score
         return None
     
+    def to_json(self) -> bytes:
+        """
+        Serialize the complete result straight to JSON bytes.
+        
+        orjson walks the (slotted) dataclasses natively, so no intermediate
+        dict is built. Unlike ``to_dict`` this includes every field, including
+        skill gaps and roadmaps.
+        """
+        return orjson.dumps(self, option=orjson.OPT_NON_STR_KEYS)
+    
     def to_dict(self) -> Dict:
-        """Convert result to dictionary for JSON serialization."""
+        """Convert result to a summary dictionary (use ``to_json`` for export)."""
         return {
             "resume_name": self.resume_name,
             "top_roles": self.top_roles,
@@ -1,7 +1,10 @@
 """Job role data model."""
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, FrozenSet, NamedTuple, Tuple
+import numpy as np
+from src.models.skill_vocabulary import SKILL_VOCABULARY
+from src.utils.text_processor import normalize_skill_name
 
 
 @dataclass
@@ -13,6 +16,16 @@ class SkillRequirement:
     description: Optional[str] = None
 
 
+class SkillArrays(NamedTuple):
+    """Column-wise (SoA) view of a role's required/preferred skill lists."""
+    required_ids: np.ndarray            # int32 SKILL_VOCABULARY ids
+    required_importance: np.ndarray     # float32
+    required_normalized: Tuple[str, ...]
+    preferred_ids: np.ndarray
+    preferred_importance: np.ndarray
+    preferred_normalized: Tuple[str, ...]
+
+
 @dataclass
 class JobRole:
     """Represents a job role with its requirements."""
@@ -39,6 +52,14 @@ class JobRole:
     # Role-specific attributes
     attributes: Dict = field(default_factory=dict)
     
+    def __setattr__(self, name, value):
+        # Reassigning a skill list invalidates the cached skill set
+        if name in ('required_skills', 'preferred_skills'):
+            self.__dict__.pop('_all_skills_cache', None)
+            self.__dict__.pop('_skill_ids_cache', None)
+            self.__dict__.pop('_skill_arrays_cache', None)
+        object.__setattr__(self, name, value)
+    
     def get_all_required_skills(self) -> List[str]:
         """Get list of all required skill names."""
         return [req.skill for req in self.required_skills]
@@ -47,9 +68,51 @@ class JobRole:
         """Get list of all preferred skill names."""
         return [req.skill for req in self.preferred_skills]
     
-    def get_all_skills(self) -> List[str]:
-        """Get all skills (required + preferred)."""
-        return list(set(self.get_all_required_skills() + self.get_all_preferred_skills()))
+    def get_all_skills(self) -> FrozenSet[str]:
+        """
+        Get all skills (required + preferred) as a cached frozenset.
+        
+        The cache is rebuilt when ``required_skills`` or ``preferred_skills``
+        is reassigned; assign a new list instead of mutating it in place.
+        """
+        cached = self.__dict__.get('_all_skills_cache')
+        if cached is None:
+            cached = self._all_skills_cache = frozenset(
+                self.get_all_required_skills() + self.get_all_preferred_skills()
+            )
+        return cached
+    
+    def get_all_skills_list(self) -> List[str]:
+        """Get all skills (required + preferred) as a list."""
+        return list(self.get_all_skills())
+    
+    def get_skill_ids(self) -> np.ndarray:
+        """Get the interned vocabulary ids of all skills (int32, cached)."""
+        cached = self.__dict__.get('_skill_ids_cache')
+        if cached is None:
+            cached = self._skill_ids_cache = SKILL_VOCABULARY.intern_all(self.get_all_skills())
+        return cached
+    
+    def get_skill_arrays(self) -> SkillArrays:
+        """
+        Get the required/preferred skills as parallel arrays (cached).
+        
+        The ``SkillRequirement`` lists stay the source of truth; this view
+        lets matchers read ids, importance weights and normalized names
+        without touching each requirement object again.
+        """
+        cached = self.__dict__.get('_skill_arrays_cache')
+        if cached is None:
+            req, pref = self.required_skills, self.preferred_skills
+            cached = self._skill_arrays_cache = SkillArrays(
+                required_ids=SKILL_VOCABULARY.intern_all(r.skill for r in req),
+                required_importance=np.fromiter((r.importance for r in req), dtype=np.float32),
+                required_normalized=tuple(normalize_skill_name(r.skill) for r in req),
+                preferred_ids=SKILL_VOCABULARY.intern_all(r.skill for r in pref),
+                preferred_importance=np.fromiter((r.importance for r in pref), dtype=np.float32),
+                preferred_normalized=tuple(normalize_skill_name(r.skill) for r in pref),
+            )
+        return cached
     
     def to_dict(self) -> Dict:
         """Convert job role to dictionary."""
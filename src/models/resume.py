@@ -1,7 +1,10 @@
 """Resume data model."""
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict
+from itertools import chain
+from typing import List, Optional, Dict, FrozenSet, Tuple
+import numpy as np
+from src.models.skill_vocabulary import SKILL_VOCABULARY
 
 
 @dataclass
@@ -43,6 +46,14 @@ class Resume:
     projects: List[str] = field(default_factory=list)
     languages: List[str] = field(default_factory=list)
     
+    def __setattr__(self, name, value):
+        # Reassigning a skill list invalidates the cached skill set
+        if name in ('skills', 'technical_skills'):
+            self.__dict__.pop('_ordered_skills_cache', None)
+            self.__dict__.pop('_all_skills_cache', None)
+            self.__dict__.pop('_skill_ids_cache', None)
+        object.__setattr__(self, name, value)
+    
     def get_section(self, name: str) -> Optional[ResumeSection]:
         """Get a specific section by name."""
         for section in self.sections:
@@ -50,9 +61,46 @@ class Resume:
                 return section
         return None
     
-    def get_all_skills(self) -> List[str]:
-        """Get all skills (technical + soft)."""
-        return list(set(self.skills + self.technical_skills))
+    def get_ordered_skills(self) -> Tuple[str, ...]:
+        """
+        Get all skills (technical + soft) deduplicated in first-seen order.
+        
+        The tuple is cached and rebuilt when ``skills`` or ``technical_skills``
+        is reassigned; assign a new list instead of mutating it in place.
+        """
+        cached = self.__dict__.get('_ordered_skills_cache')
+        if cached is None:
+            cached = self._ordered_skills_cache = tuple(
+                dict.fromkeys(chain(self.skills, self.technical_skills))
+            )
+        return cached
+    
+    def get_all_skills(self) -> FrozenSet[str]:
+        """Get all skills (technical + soft) as a cached frozenset."""
+        cached = self.__dict__.get('_all_skills_cache')
+        if cached is None:
+            cached = self._all_skills_cache = frozenset(self.get_ordered_skills())
+        return cached
+    
+    def get_all_skills_list(self) -> List[str]:
+        """Get all skills as a list in first-seen order (e.g. for JSON output)."""
+        return list(self.get_ordered_skills())
+    
+    def get_skill_ids(self) -> np.ndarray:
+        """
+        Get the vocabulary ids of the skills that some job role uses (int32, cached).
+
+        Skills no role has interned can never match, so they are dropped rather
+        than added to the shared vocabulary. The cache is keyed on the
+        vocabulary size, as roles interned later may make more skills known.
+        """
+        size = len(SKILL_VOCABULARY)
+        cached = self.__dict__.get('_skill_ids_cache')
+        if cached is None or cached[0] != size:
+            cached = self._skill_ids_cache = (
+                size, SKILL_VOCABULARY.lookup_all(self.get_ordered_skills())
+            )
+        return cached[1]
     
     def to_dict(self) -> Dict:
         """Convert resume to dictionary."""
@@ -60,7 +108,7 @@ class Resume:
             "name": self.name,
             "email": self.email,
             "phone": self.phone,
-            "skills": self.get_all_skills(),
+            "skills": self.get_all_skills_list(),
             "technical_skills": self.technical_skills,
             "soft_skills": self.soft_skills,
             "years_of_experience": self.years_of_experience,
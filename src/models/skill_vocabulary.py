@@ -0,0 +1,62 @@
+"""Canonical skill vocabulary - maps skill names to small integer ids."""
+
+import threading
+from typing import Dict, Iterable, List, Optional
+import numpy as np
+
+
+class SkillVocabulary:
+    """
+    Process-wide table of interned skill names.
+
+    Every distinct skill name gets a stable ``int`` id the first time it is
+    interned, so resumes and job roles can be compared as integer arrays
+    instead of re-hashing the same strings on every match.
+
+    Only job roles intern names; resumes look theirs up with ``lookup_all``,
+    so user input never grows the process-wide table.
+    """
+
+    def __init__(self):
+        """Initialize an empty vocabulary."""
+        self._name_to_id: Dict[str, int] = {}
+        self._id_to_name: List[str] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._id_to_name)
+
+    def intern(self, name: str) -> int:
+        """Return the id for ``name``, assigning a new one if needed."""
+        skill_id = self._name_to_id.get(name)
+        if skill_id is None:
+            with self._lock:
+                skill_id = self._name_to_id.get(name)
+                if skill_id is None:
+                    skill_id = len(self._id_to_name)
+                    self._id_to_name.append(name)
+                    self._name_to_id[name] = skill_id
+        return skill_id
+
+    def intern_all(self, names: Iterable[str]) -> np.ndarray:
+        """Intern every name and return the ids as an ``int32`` array."""
+        return np.fromiter((self.intern(n) for n in names), dtype=np.int32)
+
+    def lookup_all(self, names: Iterable[str]) -> np.ndarray:
+        """Return the ids of the already-interned names as ``int32``, skipping unknown ones."""
+        get = self._name_to_id.get
+        return np.fromiter(
+            (skill_id for skill_id in map(get, names) if skill_id is not None), dtype=np.int32
+        )
+
+    def get_id(self, name: str) -> Optional[int]:
+        """Look up the id for ``name`` without interning it."""
+        return self._name_to_id.get(name)
+
+    def name(self, skill_id: int) -> str:
+        """Return the skill name for an id."""
+        return self._id_to_name[skill_id]
+
+
+# Shared by all models and matchers
+SKILL_VOCABULARY = SkillVocabulary()
@@ -12,6 +12,7 @@ Otherwise, we provide platform search URLs (still a direct learning action).
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from urllib.parse import quote_plus
 
 
@@ -39,8 +40,8 @@ def _youtube_search(skill: str) -> ResourceLink:
 
 # Curated, stable-ish links for common skills.
 # Keep this list short and high-signal.
-_CURATED: dict[str, list[ResourceLink]] = {
-    "tensorflow": [
+_CURATED: dict[str, tuple[ResourceLink, ...]] = {
+    "tensorflow": (
         ResourceLink(
             "Coursera",
             "TensorFlow in Practice Specialization (deeplearning.ai)",
@@ -56,8 +57,8 @@ _CURATED: dict[str, list[ResourceLink]] = {
             "Udemy TensorFlow courses (search)",
             "https://www.udemy.com/courses/search/?q=tensorflow",
         ),
-    ],
-    "sql": [
+    ),
+    "sql": (
         ResourceLink(
             "Coursera",
             "SQL for Data Science (UC Davis)",
@@ -73,8 +74,8 @@ _CURATED: dict[str, list[ResourceLink]] = {
             "Udemy SQL courses (search)",
             "https://www.udemy.com/courses/search/?q=sql",
         ),
-    ],
-    "python": [
+    ),
+    "python": (
         ResourceLink(
             "Coursera",
             "Python for Everybody (University of Michigan)",
@@ -90,14 +91,16 @@ _CURATED: dict[str, list[ResourceLink]] = {
             "Udemy Python courses (search)",
             "https://www.udemy.com/courses/search/?q=python",
         ),
-    ],
+    ),
 }
 
 
-def get_resource_links(skill: str) -> list[ResourceLink]:
+@lru_cache(maxsize=512)
+def get_resource_links(skill: str) -> tuple[ResourceLink, ...]:
     """Return resource links for a skill.
 
-    Always includes Coursera/Udemy/YouTube options.
+    Always includes Coursera/Udemy/YouTube options. Results are memoized and
+    returned as an immutable tuple, since the same skills recur across roles.
     """
     key = (skill or "").strip().lower()
     curated = _CURATED.get(key)
@@ -105,4 +108,17 @@ def get_resource_links(skill: str) -> list[ResourceLink]:
         return curated
 
     # Default to platform searches (real, not fake, works for any skill)
-    return [_coursera_search(skill), _udemy_search(skill), _youtube_search(skill)]
+    return (_coursera_search(skill), _udemy_search(skill), _youtube_search(skill))
+
+
+@lru_cache(maxsize=512)
+def get_resource_dicts(skill: str) -> tuple[dict, ...]:
+    """Return the resource links for a skill as ``platform``/``title``/``url`` dicts.
+
+    The dicts are built once per skill and shared by every roadmap that
+    includes it, so callers must treat them as read-only.
+    """
+    return tuple(
+        {"platform": r.platform, "title": r.title, "url": r.url}
+        for r in get_resource_links(skill)
+    )
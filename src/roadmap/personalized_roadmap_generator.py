@@ -4,10 +4,269 @@ Generates a week-wise roadmap (default: 12 weeks ≈ 3 months) per missing skill
 including practical tasks and clickable learning resources.
 """
 
-from typing import List, Dict, Optional
-from datetime import datetime, timedelta
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from graphlib import TopologicalSorter
+from types import MappingProxyType
+from typing import FrozenSet, Iterable, Iterator, List, Dict, Mapping, NamedTuple, Optional, Tuple
+from datetime import date, timedelta
 from src.models.analysis_result import LearningPath
-from src.roadmap.learning_resources import get_resource_links
+from src.roadmap.learning_resources import get_resource_dicts
+from src.utils.text_processor import KeywordScanner
+
+
+class SkillPlan(NamedTuple):
+    """Week-wise learning plan for one skill (``_asdict()`` gives the dict form)."""
+    skill: str
+    weeks: int
+    start_week: int
+    end_week: int
+    weekly_plan: List[Dict]
+    tools: List[str]
+    resources: List[Dict]
+
+
+class WeekEntry(NamedTuple):
+    """One week of a roadmap's week-wise timeline."""
+    week: int
+    skill: str
+    focus: str
+    deliverable: str
+
+
+# (substring terms, weeks) rules, checked in order; first hit wins
+_WEEKS_RULES = (
+    (('deep learning', 'neural network', 'transformer'), 4),
+    (('machine learning', 'tensorflow', 'pytorch'), 3),
+    (('aws', 'docker', 'kubernetes', 'cloud'), 2),
+    (('statistics', 'data analysis', 'sql'), 2),
+)
+_ML_TOOL_TERMS = ('tensorflow', 'pytorch', 'machine learning', 'deep learning')
+
+# One scanner over every keyword used below, so each skill string is scanned
+# once and all the lookups work on its (memoized) set of hits
+_SKILL_KEYWORDS = KeywordScanner(
+    {term for terms, _ in _WEEKS_RULES for term in terms}
+    | set(_ML_TOOL_TERMS)
+    | {'sql', 'python'}
+)
+
+
+def _skill_keywords(skill: str) -> FrozenSet[str]:
+    """Keywords contained in the lower-cased skill name."""
+    return _SKILL_KEYWORDS.scan((skill or "").lower())
+
+
+def _match_rule(hits: FrozenSet[str], rules, default):
+    """Return the value of the first rule with a term among ``hits``."""
+    for terms, value in rules:
+        if not hits.isdisjoint(terms):
+            return value
+    return default
+
+
+# Prerequisites between common skills (lower-cased). Only edges where both
+# skills are missing affect the order.
+_PREREQUISITES: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "machine learning": ("python", "statistics"),
+    "deep learning": ("machine learning", "python"),
+    "tensorflow": ("python", "deep learning"),
+    "pytorch": ("python", "deep learning"),
+    "natural language processing": ("machine learning",),
+    "computer vision": ("deep learning",),
+    "data analysis": ("python", "sql", "statistics"),
+    "pandas": ("python",),
+    "kubernetes": ("docker",),
+    "mlops": ("machine learning", "docker"),
+})
+
+# Week-wise focus/deliverable tracks (weeks 1-4; later weeks reuse the last)
+_TF_FOCUS = (
+    "Setup + tensors + basics",
+    "Keras models + training loop",
+    "CNNs + evaluation",
+    "Mini project + review",
+)
+_TF_DELIVERABLES = (
+    "Working local environment + first TF notebook",
+    "Train a simple classifier and track metrics",
+    "Train/evaluate a CNN (e.g., image classification)",
+    "One small end-to-end TF project on GitHub",
+)
+_SQL_FOCUS = (
+    "SELECT basics + filtering",
+    "JOINs + grouping",
+    "Window functions + optimization",
+    "Dashboard-style queries + case studies",
+)
+_SQL_DELIVERABLES = (
+    "10 practice queries with correct outputs",
+    "Solve 10 JOIN + aggregation problems",
+    "Solve 10 window-function problems",
+    "A mini SQL project (schema + queries + notes)",
+)
+_GENERIC_FOCUS = (
+    "Fundamentals + setup",
+    "Hands-on practice",
+    "Intermediate concepts",
+    "Mini project + review",
+)
+_GENERIC_DELIVERABLES = (
+    "Environment ready + notes for {skill}",
+    "Practice exercises for {skill}",
+    "Intermediate exercises for {skill}",
+    "Mini project demonstrating {skill}",
+)
+# (keyword, focus, deliverables) - first matching keyword wins
+_WEEKLY_TRACKS = (
+    ("tensorflow", _TF_FOCUS, _TF_DELIVERABLES),
+    ("sql", _SQL_FOCUS, _SQL_DELIVERABLES),
+)
+_WEEKLY_TASKS = (
+    "Watch/complete one course module for {skill}",
+    "Implement 2–3 hands-on exercises for {skill}",
+    "Write a short summary + key mistakes/lessons",
+)
+
+_SUMMARY_APPROACH = (
+    "\nAPPROACH:\n"
+    "- Focus on practical tasks and projects\n"
+    "- Learn by doing, not just watching\n"
+    "- Build portfolio projects to demonstrate skills\n"
+    "- Review and document your learning\n"
+)
+
+# The helpers below are pure functions of their arguments and the same skills
+# recur across roles and users, so they are memoized at module level.
+
+@lru_cache(maxsize=512)
+def _skill_weeks_for(skill: str) -> int:
+    """Estimate weeks needed to learn a skill (simple heuristic)."""
+    return _match_rule(_skill_keywords(skill), _WEEKS_RULES, 2)
+
+
+@lru_cache(maxsize=512)
+def _tools_for(skill: str) -> Tuple[str, ...]:
+    """Tools to set up for a skill."""
+    hits = _skill_keywords(skill)
+    if not hits.isdisjoint(_ML_TOOL_TERMS):
+        tools = (
+            "Python 3.x",
+            "Jupyter Notebook / VS Code",
+            "NumPy + Pandas",
+            "GPU optional (if available)",
+        )
+        if "tensorflow" in hits:
+            tools += ("TensorFlow + Keras",)
+        if "pytorch" in hits:
+            tools += ("PyTorch",)
+        return tools
+    if "sql" in hits:
+        return ("PostgreSQL or MySQL", "SQL client (DBeaver/pgAdmin)", "Sample dataset (CSV)")
+    if "python" in hits:
+        return ("Python 3.x", "VS Code", "pip/uv", "pytest")
+    return ("Notes + weekly review checklist",)
+
+
+@lru_cache(maxsize=512)
+def _weekly_track_for(skill: str) -> Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Focus, deliverable and task strings of a skill's week-wise plan.
+    
+    The track is looked up in ``_WEEKLY_TRACKS`` by keyword; only the generic
+    track needs its deliverables formatted with the skill name.
+    """
+    hits = _skill_keywords(skill)
+    for keyword, focus, deliverables in _WEEKLY_TRACKS:
+        if keyword in hits:
+            break
+    else:
+        focus = _GENERIC_FOCUS
+        deliverables = tuple(t.format(skill=skill) for t in _GENERIC_DELIVERABLES)
+    return focus, deliverables, tuple(t.format(skill=skill) for t in _WEEKLY_TASKS)
+
+
+@lru_cache(maxsize=16)
+def _roadmap_dates_from(today: date, roadmap_days: int) -> Tuple[str, str]:
+    """ISO start/completion dates; the strings only change once a day."""
+    return today.isoformat(), (today + timedelta(days=roadmap_days)).isoformat()
+
+
+def _format_summary(
+    skill_plans: List[SkillPlan],
+    target_role: str,
+    today_str: str,
+    completion_str: str
+) -> str:
+    """Format the text summary of a week-wise roadmap."""
+    total_skills = len(skill_plans)
+    total_weeks = sum(plan.weeks for plan in skill_plans)
+    
+    summary = f"""
+12-Week (3-Month) Learning Roadmap for {target_role}
+
+OVERVIEW:
+- Target Role: {target_role}
+- Skills to Learn: {total_skills}
+- Timeline: {total_weeks} weeks
+- Start Date: {today_str}
+- Completion Date: {completion_str}
+
+SKILLS COVERED:
+"""
+    parts = [summary]
+    parts.extend(
+        f"{i}. {plan.skill} ({plan.weeks} weeks, "
+        f"Weeks {plan.start_week}-{plan.end_week})\n"
+        for i, plan in enumerate(skill_plans, 1)
+    )
+    parts.append(_SUMMARY_APPROACH)
+    
+    return "".join(parts).strip()
+
+
+@dataclass
+class Roadmap:
+    """
+    A generated week-wise roadmap.
+    
+    The summary text is built lazily on first access and the week-wise
+    timeline is a generator, so callers that only need the skill plans (or
+    one page of weeks, via ``itertools.islice``) don't pay for the rest.
+    ``to_dict()`` gives the dictionary returned by ``generate_roadmap``.
+    """
+    target_role: str
+    roadmap_days: int
+    roadmap_weeks: int
+    skill_plans: List[SkillPlan]
+    start_date: str
+    estimated_completion: str
+    
+    @cached_property
+    def summary(self) -> str:
+        return _format_summary(
+            self.skill_plans, self.target_role, self.start_date, self.estimated_completion
+        )
+    
+    def timeline(self) -> Iterator[WeekEntry]:
+        """Yield the roadmap week by week across all skill plans."""
+        for plan in self.skill_plans:
+            for week in plan.weekly_plan:
+                yield WeekEntry(week['week'], plan.skill, week['focus'], week['deliverable'])
+    
+    def to_dict(self) -> Dict:
+        """Materialize the roadmap as a plain dictionary."""
+        return {
+            'target_role': self.target_role,
+            'roadmap_days': self.roadmap_days,
+            'roadmap_weeks': self.roadmap_weeks,
+            'skill_plans': [plan._asdict() for plan in self.skill_plans],
+            # Backward-compatible: day-wise timeline no longer generated (week-wise is source of truth)
+            'timeline': [],
+            'summary': self.summary,
+            'total_skills': len(self.skill_plans),
+            'estimated_completion': self.estimated_completion
+        }
 
 
 class PersonalizedRoadmapGenerator:
@@ -25,13 +284,13 @@ class PersonalizedRoadmapGenerator:
             roadmap_days: Number of days for roadmap (default: 84 = 12 weeks)
         """
         self.roadmap_days = roadmap_days
-        self.skill_tasks = self._load_skill_tasks()
+        self.roadmap_weeks = max(1, roadmap_days // 7)
     
     def generate_roadmap(
         self,
         missing_skills: List[str],
         target_role: str,
-        required_skills: Optional[List[str]] = None
+        required_skills: Optional[Iterable[str]] = None
     ) -> Dict:
         """
         Generate personalized learning roadmap.
@@ -39,22 +298,34 @@ class PersonalizedRoadmapGenerator:
         Args:
             missing_skills: List of missing skills to learn
             target_role: Target job role name
-            required_skills: List of all required skills (for prioritization)
+            required_skills: All required skills (for prioritization); a
+                frozenset can be built once and reused across calls
             
         Returns:
             Dictionary with:
             - skill_plans: Skill-wise learning plans (week-wise)
             - summary: Roadmap summary
         """
-        # Prioritize skills (required first)
-        if required_skills:
-            prioritized_skills = self._prioritize_skills(missing_skills, required_skills)
-        else:
-            prioritized_skills = missing_skills
+        return self.build_roadmap(missing_skills, target_role, required_skills).to_dict()
+    
+    def build_roadmap(
+        self,
+        missing_skills: List[str],
+        target_role: str,
+        required_skills: Optional[Iterable[str]] = None
+    ) -> Roadmap:
+        """
+        Generate a roadmap whose summary and timeline are built on demand.
+        
+        Takes the same arguments as ``generate_roadmap``.
+        """
+        # Prioritize skills (prerequisites first, then required before preferred);
+        # with no required skills the partition keeps the input order
+        prioritized_skills = self._prioritize_skills(missing_skills, required_skills or frozenset())
         
         # Generate skill-wise plans (allocate weeks across skills)
-        skill_plans: List[Dict] = []
-        total_weeks = max(1, self.roadmap_days // 7)
+        skill_plans: List[SkillPlan] = []
+        total_weeks = self.roadmap_weeks
         weeks_allocated = 0
 
         for skill in prioritized_skills:
@@ -70,367 +341,118 @@ class PersonalizedRoadmapGenerator:
             skill_plans.append(skill_plan)
             weeks_allocated += weeks_needed
         
-        # Generate summary
-        summary = self._generate_summary(skill_plans, target_role)
-        
-        return {
-            'target_role': target_role,
-            'roadmap_days': self.roadmap_days,
-            'roadmap_weeks': total_weeks,
-            'skill_plans': skill_plans,
-            # Backward-compatible: timeline no longer generated (week-wise is source of truth)
-            'timeline': [],
-            'summary': summary,
-            'total_skills': len(skill_plans),
-            'estimated_completion': (datetime.now() + timedelta(days=self.roadmap_days)).strftime("%Y-%m-%d")
-        }
+        today_str, completion_str = self._roadmap_dates()
+        return Roadmap(
+            target_role=target_role,
+            roadmap_days=self.roadmap_days,
+            roadmap_weeks=total_weeks,
+            skill_plans=skill_plans,
+            start_date=today_str,
+            estimated_completion=completion_str,
+        )
 
     def _estimate_skill_weeks(self, skill: str) -> int:
         """Estimate weeks needed to learn a skill (simple heuristic)."""
-        skill_lower = (skill or "").lower()
-
-        if any(term in skill_lower for term in ['deep learning', 'neural network', 'transformer']):
-            return 4
-        if any(term in skill_lower for term in ['machine learning', 'tensorflow', 'pytorch']):
-            return 3
-        if any(term in skill_lower for term in ['aws', 'docker', 'kubernetes', 'cloud']):
-            return 2
-        if any(term in skill_lower for term in ['statistics', 'data analysis', 'sql']):
-            return 2
-        return 2
+        return _skill_weeks_for(skill)
     
     def _prioritize_skills(
         self,
         missing_skills: List[str],
-        required_skills: List[str]
+        required_skills: Iterable[str]
     ) -> List[str]:
-        """Prioritize skills: required skills first."""
-        required_missing = [s for s in missing_skills if s in required_skills]
-        preferred_missing = [s for s in missing_skills if s not in required_skills]
-        return required_missing + preferred_missing
-    
-    def _estimate_skill_days(self, skill: str) -> int:
-        """Estimate days needed to learn a skill."""
-        skill_lower = skill.lower()
+        """
+        Prioritize skills: prerequisites first, then required before preferred.
         
-        # Simple estimation based on skill complexity
-        if any(term in skill_lower for term in ['deep learning', 'neural network', 'transformer']):
-            return 7
-        elif any(term in skill_lower for term in ['machine learning', 'tensorflow', 'pytorch']):
-            return 5
-        elif any(term in skill_lower for term in ['aws', 'docker', 'kubernetes', 'cloud']):
-            return 4
-        elif any(term in skill_lower for term in ['statistics', 'data analysis']):
-            return 3
-        else:
-            return 3  # Default
+        Missing skills are topologically sorted over ``_PREREQUISITES``. Among
+        the skills that are ready at each step, required skills (and the
+        missing prerequisites they depend on) come first; ties keep their
+        input order.
+        """
+        required = frozenset(required_skills)  # returned as-is if already a frozenset
+        skills = list(dict.fromkeys(missing_skills))
+        by_lower = {s.lower(): s for s in skills}
+        prereqs = {
+            s: [by_lower[p] for p in _PREREQUISITES.get(s.lower(), ()) if p in by_lower and by_lower[p] != s]
+            for s in skills
+        }
+        
+        # Seed from the required skills and pull in everything they depend on
+        seeded = set()
+        stack = [s for s in skills if s in required]
+        while stack:
+            skill = stack.pop()
+            if skill not in seeded:
+                seeded.add(skill)
+                stack.extend(prereqs[skill])
+        rank = {s: (0 if s in seeded else 1, i) for i, s in enumerate(skills)}
+        
+        sorter = TopologicalSorter(prereqs)
+        sorter.prepare()
+        
+        ordered: List[str] = []
+        ready = list(sorter.get_ready())
+        while ready:
+            ready.sort(key=rank.__getitem__)
+            skill = ready.pop(0)
+            ordered.append(skill)
+            sorter.done(skill)
+            ready.extend(sorter.get_ready())
+        return ordered
     
     def _create_skill_plan(
         self,
         skill: str,
         weeks: int,
         start_week: int
-    ) -> Dict:
+    ) -> SkillPlan:
         """Create a week-wise learning plan for a specific skill."""
         weekly_plan = self._get_weekly_plan(skill, weeks, start_week)
         tools = self._get_tools_for_skill(skill)
 
-        links = get_resource_links(skill)
-        resources = [
-            {"platform": r.platform, "title": r.title, "url": r.url}
-            for r in links
-        ]
+        # The resource dicts are cached per skill and shared read-only
+        resources = list(get_resource_dicts(skill))
 
-        return {
-            'skill': skill,
-            'weeks': weeks,
-            'start_week': start_week,
-            'end_week': start_week + weeks - 1,
-            'weekly_plan': weekly_plan,
-            'tools': tools,
-            'resources': resources,
-        }
+        return SkillPlan(
+            skill=skill,
+            weeks=weeks,
+            start_week=start_week,
+            end_week=start_week + weeks - 1,
+            weekly_plan=weekly_plan,
+            tools=tools,
+            resources=resources,
+        )
 
     def _get_tools_for_skill(self, skill: str) -> List[str]:
-        skill_lower = (skill or "").lower()
-        tools = ["Notes + weekly review checklist"]
-
-        if any(x in skill_lower for x in ["tensorflow", "pytorch", "machine learning", "deep learning"]):
-            tools = [
-                "Python 3.x",
-                "Jupyter Notebook / VS Code",
-                "NumPy + Pandas",
-                "GPU optional (if available)",
-            ]
-            if "tensorflow" in skill_lower:
-                tools.append("TensorFlow + Keras")
-            if "pytorch" in skill_lower:
-                tools.append("PyTorch")
-        elif "sql" in skill_lower:
-            tools = ["PostgreSQL or MySQL", "SQL client (DBeaver/pgAdmin)", "Sample dataset (CSV)"]
-        elif "python" in skill_lower:
-            tools = ["Python 3.x", "VS Code", "pip/uv", "pytest"]
-
-        return tools
+        """Tools to set up for a skill (a fresh list; the cached tuple is shared)."""
+        return list(_tools_for(skill))
 
     def _get_weekly_plan(self, skill: str, weeks: int, start_week: int) -> List[Dict]:
         """Generate a practical, week-wise plan."""
-        s = (skill or "").strip()
-        s_lower = s.lower()
-
-        plan: List[Dict] = []
-        for i in range(weeks):
-            w = start_week + i
-
-            if "tensorflow" in s_lower:
-                focus = [
-                    "Setup + tensors + basics",
-                    "Keras models + training loop",
-                    "CNNs + evaluation",
-                    "Mini project + review",
-                ][min(i, 3)]
-                deliverable = [
-                    "Working local environment + first TF notebook",
-                    "Train a simple classifier and track metrics",
-                    "Train/evaluate a CNN (e.g., image classification)",
-                    "One small end-to-end TF project on GitHub",
-                ][min(i, 3)]
-            elif "sql" in s_lower:
-                focus = [
-                    "SELECT basics + filtering",
-                    "JOINs + grouping",
-                    "Window functions + optimization",
-                    "Dashboard-style queries + case studies",
-                ][min(i, 3)]
-                deliverable = [
-                    "10 practice queries with correct outputs",
-                    "Solve 10 JOIN + aggregation problems",
-                    "Solve 10 window-function problems",
-                    "A mini SQL project (schema + queries + notes)",
-                ][min(i, 3)]
-            else:
-                focus = [
-                    "Fundamentals + setup",
-                    "Hands-on practice",
-                    "Intermediate concepts",
-                    "Mini project + review",
-                ][min(i, 3)]
-                deliverable = [
-                    f"Environment ready + notes for {s}",
-                    f"Practice exercises for {s}",
-                    f"Intermediate exercises for {s}",
-                    f"Mini project demonstrating {s}",
-                ][min(i, 3)]
-
-            plan.append(
-                {
-                    "week": w,
-                    "focus": focus,
-                    "deliverable": deliverable,
-                    "tasks": [
-                        f"Watch/complete one course module for {s}",
-                        f"Implement 2–3 hands-on exercises for {s}",
-                        "Write a short summary + key mistakes/lessons",
-                    ],
-                }
-            )
-        return plan
-    
-    def _get_practical_tasks(self, skill: str, days: int) -> List[Dict]:
-        """Get practical tasks for learning a skill."""
-        skill_lower = skill.lower()
-        
-        # Get base tasks from skill_tasks dictionary
-        base_tasks = self.skill_tasks.get(skill, [])
-        
-        if base_tasks:
-            # Use predefined tasks, adjust for days
-            tasks = base_tasks[:days]
-            return tasks
-        
-        # Generate generic tasks based on skill type
-        tasks = []
-        
-        if days >= 1:
-            tasks.append({
-                'day': 1,
-                'task': f"Set up environment and complete '{skill}' tutorial",
-                'type': 'setup'
-            })
-        
-        if days >= 2:
-            tasks.append({
-                'day': 2,
-                'task': f"Build a simple '{skill}' project (Hello World equivalent)",
-                'type': 'practice'
-            })
-        
-        if days >= 3:
-            tasks.append({
-                'day': 3,
-                'task': f"Complete hands-on exercise: '{skill}' basics",
-                'type': 'practice'
-            })
-        
-        if days >= 4:
-            tasks.append({
-                'day': 4,
-                'task': f"Build intermediate '{skill}' project",
-                'type': 'project'
-            })
-        
-        if days >= 5:
-            tasks.append({
-                'day': 5,
-                'task': f"Practice advanced '{skill}' concepts",
-                'type': 'practice'
-            })
-        
-        if days >= 6:
-            tasks.append({
-                'day': 6,
-                'task': f"Build portfolio project using '{skill}'",
-                'type': 'project'
-            })
-        
-        if days >= 7:
-            tasks.append({
-                'day': 7,
-                'task': f"Review and document '{skill}' knowledge",
-                'type': 'review'
-            })
-        
-        return tasks[:days]
-    
-    def _get_learning_resources(self, skill: str) -> List[str]:
-        """Get learning resources for a skill."""
-        skill_lower = skill.lower()
-        
-        resources = []
-        
-        # Add official documentation
-        if 'python' in skill_lower:
-            resources.append("Python.org Official Tutorial")
-        elif 'tensorflow' in skill_lower:
-            resources.append("TensorFlow Official Tutorials")
-        elif 'pytorch' in skill_lower:
-            resources.append("PyTorch Official Tutorials")
-        elif 'aws' in skill_lower:
-            resources.append("AWS Free Tier (Hands-on Practice)")
-        elif 'docker' in skill_lower:
-            resources.append("Docker Official Getting Started Guide")
-        
-        # Add practice platforms
-        if any(term in skill_lower for term in ['python', 'programming', 'coding']):
-            resources.append("LeetCode / HackerRank (Practice Problems)")
-        
-        if any(term in skill_lower for term in ['machine learning', 'ml', 'data science']):
-            resources.append("Kaggle Learn (Free Courses)")
-        
-        # Add generic resources
-        resources.append(f"Search YouTube for '{skill} tutorial'")
-        resources.append(f"Build a project using {skill}")
-        
-        return resources[:5]  # Top 5 resources
+        # Weeks past the fourth repeat the last entry; the tasks tuple is shared by all weeks
+        focus_tbl, deliverable_tbl, tasks = _weekly_track_for((skill or "").strip())
+
+        return [
+            {
+                "week": start_week + i,
+                "focus": focus_tbl[i if i < 3 else 3],
+                "deliverable": deliverable_tbl[i if i < 3 else 3],
+                "tasks": tasks,
+            }
+            for i in range(weeks)
+        ]
     
-    def _create_timeline(self, skill_plans: List[Dict]) -> List[Dict]:
-        """Create day-by-day timeline."""
-        timeline = []
-        
-        for plan in skill_plans:
-            for day in range(plan['start_day'], plan['end_day'] + 1):
-                task_index = day - plan['start_day']
-                if task_index < len(plan['tasks']):
-                    task = plan['tasks'][task_index]
-                    timeline.append({
-                        'day': day,
-                        'skill': plan['skill'],
-                        'task': task['task'],
-                        'type': task.get('type', 'practice')
-                    })
-        
-        return timeline
+    def _roadmap_dates(self) -> Tuple[str, str]:
+        """Start and completion dates (YYYY-MM-DD) from a single clock read."""
+        return _roadmap_dates_from(date.today(), self.roadmap_days)
     
-    def _generate_summary(self, skill_plans: List[Dict], target_role: str) -> str:
+    def _generate_summary(
+        self,
+        skill_plans: List[SkillPlan],
+        target_role: str,
+        today_str: Optional[str] = None,
+        completion_str: Optional[str] = None
+    ) -> str:
         """Generate roadmap summary."""
-        total_skills = len(skill_plans)
-        total_weeks = sum(plan.get('weeks', 0) for plan in skill_plans)
-        
-        summary = f"""
-    12-Week (3-Month) Learning Roadmap for {target_role}
-
-OVERVIEW:
-- Target Role: {target_role}
-- Skills to Learn: {total_skills}
-- Timeline: {total_weeks} weeks
-- Start Date: {datetime.now().strftime('%Y-%m-%d')}
-- Completion Date: {(datetime.now() + timedelta(days=self.roadmap_days)).strftime('%Y-%m-%d')}
-
-SKILLS COVERED:
-"""
-        for i, plan in enumerate(skill_plans, 1):
-            summary += (
-                f"{i}. {plan['skill']} ({plan.get('weeks', 0)} weeks, "
-                f"Weeks {plan.get('start_week', 0)}-{plan.get('end_week', 0)})\n"
-            )
-        
-        summary += "\nAPPROACH:\n"
-        summary += "- Focus on practical tasks and projects\n"
-        summary += "- Learn by doing, not just watching\n"
-        summary += "- Build portfolio projects to demonstrate skills\n"
-        summary += "- Review and document your learning\n"
-        
-        return summary.strip()
-    
-    def _load_skill_tasks(self) -> Dict[str, List[Dict]]:
-        """Load predefined practical tasks for common skills."""
-        return {
-            "Python": [
-                {'day': 1, 'task': 'Install Python and set up IDE (VS Code/PyCharm)', 'type': 'setup'},
-                {'day': 2, 'task': 'Complete Python basics tutorial (variables, loops, functions)', 'type': 'practice'},
-                {'day': 3, 'task': 'Build a simple calculator or to-do list app', 'type': 'project'},
-                {'day': 4, 'task': 'Learn file handling and data structures (lists, dicts)', 'type': 'practice'},
-                {'day': 5, 'task': 'Build a data processing script (CSV/JSON)', 'type': 'project'},
-            ],
-            "Machine Learning": [
-                {'day': 1, 'task': 'Set up ML environment (scikit-learn, pandas)', 'type': 'setup'},
-                {'day': 2, 'task': 'Complete scikit-learn tutorial (linear regression)', 'type': 'practice'},
-                {'day': 3, 'task': 'Build a simple prediction model (house prices)', 'type': 'project'},
-                {'day': 4, 'task': 'Learn classification algorithms (logistic regression)', 'type': 'practice'},
-                {'day': 5, 'task': 'Build a classification project (spam detection)', 'type': 'project'},
-            ],
-            "TensorFlow": [
-                {'day': 1, 'task': 'Install TensorFlow and run first neural network', 'type': 'setup'},
-                {'day': 2, 'task': 'Complete TensorFlow basics tutorial', 'type': 'practice'},
-                {'day': 3, 'task': 'Build a simple image classifier (MNIST)', 'type': 'project'},
-                {'day': 4, 'task': 'Learn CNN architecture and build custom model', 'type': 'practice'},
-                {'day': 5, 'task': 'Deploy model using TensorFlow Serving', 'type': 'project'},
-            ],
-            "Deep Learning": [
-                {'day': 1, 'task': 'Understand neural network basics (perceptron)', 'type': 'practice'},
-                {'day': 2, 'task': 'Build a simple neural network from scratch', 'type': 'project'},
-                {'day': 3, 'task': 'Learn backpropagation and gradient descent', 'type': 'practice'},
-                {'day': 4, 'task': 'Build a deep neural network (3+ layers)', 'type': 'project'},
-                {'day': 5, 'task': 'Learn about CNNs and RNNs', 'type': 'practice'},
-                {'day': 6, 'task': 'Build a CNN for image classification', 'type': 'project'},
-                {'day': 7, 'task': 'Build an RNN for text processing', 'type': 'project'},
-            ],
-            "AWS": [
-                {'day': 1, 'task': 'Create AWS free tier account and explore console', 'type': 'setup'},
-                {'day': 2, 'task': 'Launch EC2 instance and connect via SSH', 'type': 'practice'},
-                {'day': 3, 'task': 'Set up S3 bucket and upload/download files', 'type': 'practice'},
-                {'day': 4, 'task': 'Deploy a simple web app on EC2', 'type': 'project'},
-            ],
-            "Docker": [
-                {'day': 1, 'task': 'Install Docker and run first container', 'type': 'setup'},
-                {'day': 2, 'task': 'Create Dockerfile for a Python app', 'type': 'practice'},
-                {'day': 3, 'task': 'Build and run containerized application', 'type': 'project'},
-                {'day': 4, 'task': 'Learn Docker Compose for multi-container apps', 'type': 'practice'},
-            ],
-            "Statistics": [
-                {'day': 1, 'task': 'Review basic statistics concepts (mean, median, std)', 'type': 'practice'},
-                {'day': 2, 'task': 'Learn hypothesis testing (t-test, chi-square)', 'type': 'practice'},
-                {'day': 3, 'task': 'Apply statistics to a real dataset', 'type': 'project'},
-            ],
-        }
-
+        if today_str is None or completion_str is None:
+            today_str, completion_str = self._roadmap_dates()
+        return _format_summary(skill_plans, target_role, today_str, completion_str)
@@ -1,8 +1,111 @@
 """Learning roadmap generator - creates personalized learning paths."""
 
-from typing import List, Dict, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Dict, Mapping, Optional, Tuple
 from src.models.analysis_result import LearningPath, SkillGap
 from src.models.job_role import JobRole
+from src.roadmap.skill_gaps import sort_gaps_by_priority
+from src.utils.text_processor import KeywordScanner
+
+
+# Specific skill -> resource mappings, checked before the keyword rules.
+# Shared read-only by all instances (this can be loaded from a JSON/YAML file).
+_DEFAULT_RESOURCES: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    # Add specific skill-resource mappings here
+})
+
+# (keywords, multiplier of the base days) - first matching rule wins
+_DAYS_MULTIPLIERS = (
+    (('deep learning', 'neural network', 'transformer'), 3),
+    (('machine learning', 'data science', 'nlp'), 2),
+    (('cloud', 'aws', 'azure', 'gcp'), 2),
+)
+
+# (keywords, resources) - first matching rule wins
+_RESOURCE_RULES = (
+    (('python', 'programming', 'coding'), (
+        "Python Official Documentation",
+        "Python for Data Science (Coursera)",
+        "Python Crash Course (Book)",
+    )),
+    (('machine learning', 'ml'), (
+        "Machine Learning Course by Andrew Ng (Coursera)",
+        "Scikit-learn Documentation",
+        "Hands-On Machine Learning (Book)",
+    )),
+    (('deep learning', 'neural network'), (
+        "Deep Learning Specialization (Coursera)",
+        "Fast.ai Practical Deep Learning",
+        "Deep Learning Book by Ian Goodfellow",
+    )),
+    (('tensorflow', 'keras'), (
+        "TensorFlow Official Tutorials",
+        "TensorFlow Developer Certificate",
+        "Deep Learning with TensorFlow (Course)",
+    )),
+    (('pytorch',), (
+        "PyTorch Official Tutorials",
+        "Deep Learning with PyTorch (Course)",
+    )),
+    (('aws', 'cloud'), (
+        "AWS Certified Solutions Architect",
+        "AWS Free Tier (Hands-on Practice)",
+        "AWS Documentation",
+    )),
+)
+
+# (keywords, prerequisites) - every matching rule contributes
+_PREREQUISITE_RULES = (
+    (('machine learning', 'deep learning', 'tensorflow', 'pytorch'), ('Python', 'Mathematics/Statistics')),
+    (('deep learning', 'neural network'), ('Machine Learning', 'Linear Algebra')),
+    (('data science', 'data analysis'), ('Python', 'SQL', 'Statistics')),
+    (('aws', 'azure', 'gcp', 'cloud'), ('Linux/Command Line', 'Networking Basics')),
+)
+
+# Single scanner over all keywords above; each skill is scanned once
+_KEYWORDS = KeywordScanner(
+    term
+    for rules in (_DAYS_MULTIPLIERS, _RESOURCE_RULES, _PREREQUISITE_RULES)
+    for terms, _ in rules
+    for term in terms
+)
+
+
+@lru_cache(maxsize=1024)
+def _learning_days_for(skill_lower: str, category: str) -> int:
+    """Estimated learning days for a lower-cased skill name and gap category."""
+    # Required skills typically need more time
+    base_days = 14 if category == 'required' else 7
+    
+    # Adjust based on skill complexity (simple keyword matching)
+    hits = _KEYWORDS.scan(skill_lower)
+    for terms, multiplier in _DAYS_MULTIPLIERS:
+        if not hits.isdisjoint(terms):
+            return base_days * multiplier
+    return base_days
+
+
+@lru_cache(maxsize=1024)
+def _prerequisites_for(skill_lower: str) -> Tuple[str, ...]:
+    """Common prerequisites for a lower-cased skill name."""
+    hits = _KEYWORDS.scan(skill_lower)
+    return _combined_prerequisites(tuple(
+        i for i, (terms, _) in enumerate(_PREREQUISITE_RULES) if not hits.isdisjoint(terms)
+    ))
+
+
+@lru_cache(maxsize=None)
+def _combined_prerequisites(rule_indices: Tuple[int, ...]) -> Tuple[str, ...]:
+    """
+    Prerequisites of the matched rules, concatenated in rule order.
+    
+    Keyed by the matched rule indices, so every skill that hits the same
+    rules shares one tuple (a single rule returns its constant tuple).
+    """
+    if len(rule_indices) == 1:
+        return _PREREQUISITE_RULES[rule_indices[0]][1]
+    return tuple(p for i in rule_indices for p in _PREREQUISITE_RULES[i][1])
 
 
 class RoadmapGenerator:
@@ -40,11 +143,7 @@ class RoadmapGenerator:
         
         # Sort gaps by priority
         if prioritize_by_importance:
-            sorted_gaps = sorted(
-                skill_gaps,
-                key=lambda x: (0 if x.category == 'required' else 1, -x.importance),
-                reverse=False
-            )
+            sorted_gaps = sort_gaps_by_priority(skill_gaps)
         else:
             sorted_gaps = skill_gaps
         
@@ -80,104 +179,33 @@ class RoadmapGenerator:
         
         Simple heuristic - can be enhanced with ML or data.
         """
-        # Required skills typically need more time
-        base_days = 14 if category == 'required' else 7
-        
-        # Adjust based on skill complexity (simple keyword matching)
-        skill_lower = skill.lower()
-        
-        if any(term in skill_lower for term in ['deep learning', 'neural network', 'transformer']):
-            return base_days * 3
-        elif any(term in skill_lower for term in ['machine learning', 'data science', 'nlp']):
-            return base_days * 2
-        elif any(term in skill_lower for term in ['cloud', 'aws', 'azure', 'gcp']):
-            return base_days * 2
-        else:
-            return base_days
+        return _learning_days_for(skill.lower(), category)
     
     def _get_learning_resources(self, skill: str) -> List[str]:
         """Get learning resources for a skill."""
-        skill_lower = skill.lower()
-        
-        # Check if we have specific resources
+        # Check if we have specific resources (copied: callers extend the list)
         if skill in self.learning_resources:
-            return self.learning_resources[skill]
+            return list(self.learning_resources[skill])
         
         # Generic resources based on skill type
-        if any(term in skill_lower for term in ['python', 'programming', 'coding']):
-            return [
-                "Python Official Documentation",
-                "Python for Data Science (Coursera)",
-                "Python Crash Course (Book)",
-            ]
-        elif any(term in skill_lower for term in ['machine learning', 'ml']):
-            return [
-                "Machine Learning Course by Andrew Ng (Coursera)",
-                "Scikit-learn Documentation",
-                "Hands-On Machine Learning (Book)",
-            ]
-        elif any(term in skill_lower for term in ['deep learning', 'neural network']):
-            return [
-                "Deep Learning Specialization (Coursera)",
-                "Fast.ai Practical Deep Learning",
-                "Deep Learning Book by Ian Goodfellow",
-            ]
-        elif any(term in skill_lower for term in ['tensorflow', 'keras']):
-            return [
-                "TensorFlow Official Tutorials",
-                "TensorFlow Developer Certificate",
-                "Deep Learning with TensorFlow (Course)",
-            ]
-        elif any(term in skill_lower for term in ['pytorch']):
-            return [
-                "PyTorch Official Tutorials",
-                "Deep Learning with PyTorch (Course)",
-            ]
-        elif any(term in skill_lower for term in ['aws', 'cloud']):
-            return [
-                "AWS Certified Solutions Architect",
-                "AWS Free Tier (Hands-on Practice)",
-                "AWS Documentation",
-            ]
-        else:
-            return [
-                f"Search for '{skill}' tutorials on Coursera/edX",
-                f"Read documentation for {skill}",
-                f"Practice {skill} with hands-on projects",
-            ]
+        hits = _KEYWORDS.scan(skill.lower())
+        for terms, resources in _RESOURCE_RULES:
+            if not hits.isdisjoint(terms):
+                return list(resources)
+        
+        return [
+            f"Search for '{skill}' tutorials on Coursera/edX",
+            f"Read documentation for {skill}",
+            f"Practice {skill} with hands-on projects",
+        ]
     
-    def _get_prerequisites(self, skill: str) -> List[str]:
-        """Get prerequisite skills."""
-        skill_lower = skill.lower()
-        
-        prerequisites = []
-        
-        # Common prerequisites
-        if any(term in skill_lower for term in ['machine learning', 'deep learning', 'tensorflow', 'pytorch']):
-            prerequisites.append('Python')
-            prerequisites.append('Mathematics/Statistics')
-        
-        if any(term in skill_lower for term in ['deep learning', 'neural network']):
-            prerequisites.append('Machine Learning')
-            prerequisites.append('Linear Algebra')
-        
-        if any(term in skill_lower for term in ['data science', 'data analysis']):
-            prerequisites.append('Python')
-            prerequisites.append('SQL')
-            prerequisites.append('Statistics')
-        
-        if any(term in skill_lower for term in ['aws', 'azure', 'gcp', 'cloud']):
-            prerequisites.append('Linux/Command Line')
-            prerequisites.append('Networking Basics')
-        
-        return prerequisites
+    def _get_prerequisites(self, skill: str) -> Tuple[str, ...]:
+        """Get prerequisite skills (a shared, immutable tuple)."""
+        return _prerequisites_for(skill.lower())
     
-    def _load_default_resources(self) -> Dict[str, List[str]]:
-        """Load default learning resources."""
-        # This can be loaded from a JSON/YAML file
-        return {
-            # Add specific skill-resource mappings here
-        }
+    def _load_default_resources(self) -> Mapping[str, Tuple[str, ...]]:
+        """Load default learning resources (the shared read-only table)."""
+        return _DEFAULT_RESOURCES
     
     def create_timeline(self, roadmap_items: List[LearningPath], total_days: Optional[int] = None) -> Dict:
         """
@@ -190,23 +218,26 @@ class RoadmapGenerator:
         Returns:
             Dictionary with timeline breakdown
         """
+        # One pass builds the items and sums the estimates
+        estimated_total = 0
+        items = []
+        for item in roadmap_items:
+            estimated_total += item.estimated_days
+            items.append({
+                'skill': item.skill,
+                'priority': item.priority,
+                'days': item.estimated_days,
+                'resources': item.resources[:3],  # Top 3 resources
+            })
+        
         if total_days is None:
-            total_days = sum(item.estimated_days for item in roadmap_items)
+            total_days = estimated_total
         
         timeline = {
             'total_days': total_days,
             'weeks': round(total_days / 7, 1),
             'months': round(total_days / 30, 1),
-            'items': [
-                {
-                    'skill': item.skill,
-                    'priority': item.priority,
-                    'days': item.estimated_days,
-                    'resources': item.resources[:3],  # Top 3 resources
-                }
-                for item in roadmap_items
-            ]
+            'items': items,
         }
         
         return timeline
-
@@ -1,10 +1,33 @@
 """Skill gap analyzer - identifies missing skills."""
 
-from typing import List, Dict
+import sys
+from operator import attrgetter
+from typing import Iterable, List, Dict, Optional
 from src.models.job_role import JobRole
 from src.models.analysis_result import SkillGap
 from src.core.skill_matcher import SkillMatcher
 
+_REQUIRED = sys.intern('required')
+_PREFERRED = sys.intern('preferred')
+
+# SkillRequirement fields copied into a SkillGap, and the gap sort key
+_gap_fields = attrgetter('skill', 'importance', 'description')
+_by_importance = attrgetter('importance')
+
+
+def sort_gaps_by_priority(gaps: List[SkillGap]) -> List[SkillGap]:
+    """
+    Order gaps required-first, each group by descending importance.
+    
+    Stable partition plus a C-level ``attrgetter`` sort per group; ties keep
+    their input order, same as sorting on ``(category rank, -importance)``.
+    """
+    required = [g for g in gaps if g.category == _REQUIRED]
+    preferred = [g for g in gaps if g.category != _REQUIRED]
+    required.sort(key=_by_importance, reverse=True)
+    preferred.sort(key=_by_importance, reverse=True)
+    return required + preferred
+
 
 class SkillGapAnalyzer:
     """Analyze skill gaps between resume and job requirements."""
@@ -16,7 +39,8 @@ class SkillGapAnalyzer:
     def analyze_gaps(
         self,
         resume_skills: List[str],
-        job_role: JobRole
+        job_role: JobRole,
+        match_result: Optional[Dict] = None
     ) -> List[SkillGap]:
         """
         Identify skill gaps for a job role.
@@ -24,37 +48,55 @@ class SkillGapAnalyzer:
         Args:
             resume_skills: List of skills from resume
             job_role: Job role to analyze against
+            match_result: Pre-computed SkillMatcher.match_skills result (optional)
             
         Returns:
             List of SkillGap objects
         """
         # Match skills to get missing ones
-        match_result = self.skill_matcher.match_skills(resume_skills, job_role)
+        if match_result is None:
+            match_result = self.skill_matcher.match_skills(resume_skills, job_role)
         
-        gaps = []
-        
-        # Process missing required skills
-        for req in match_result['missing_required']:
-            gap = SkillGap(
-                skill=req.skill,
-                category='required',
-                importance=req.importance,
-                description=req.description,
-            )
-            gaps.append(gap)
+        return self._gaps_from_match(match_result)
+    
+    def analyze_gaps_batch(
+        self,
+        resume_skills: List[str],
+        job_roles: Iterable[JobRole]
+    ) -> List[List[SkillGap]]:
+        """
+        Identify skill gaps for several job roles at once.
         
-        # Process missing preferred skills (lower priority)
-        for pref in match_result['missing_preferred']:
-            gap = SkillGap(
-                skill=pref.skill,
-                category='preferred',
-                importance=pref.importance,
-                description=pref.description,
-            )
-            gaps.append(gap)
+        The resume skills are normalized once and requirements shared by
+        several roles are matched once (see SkillMatcher.match_skills_batch).
         
-        # Sort by importance (required first, then by importance value)
-        gaps.sort(key=lambda x: (0 if x.category == 'required' else 1, -x.importance))
+        Args:
+            resume_skills: List of skills from resume
+            job_roles: Job roles to analyze against
+            
+        Returns:
+            One list of SkillGap objects per role, in role order
+        """
+        return [
+            self._gaps_from_match(match_result)
+            for match_result in self.skill_matcher.match_skills_batch(resume_skills, job_roles)
+        ]
+    
+    @staticmethod
+    def _gaps_from_match(match_result: Dict) -> List[SkillGap]:
+        """Build the sorted SkillGap list from a SkillMatcher match result."""
+        # Missing skills arrive already split by category, so each group is
+        # built in one comprehension and sorted on its own (no partition pass)
+        required = [
+            SkillGap(skill=skill, category=_REQUIRED, importance=importance, description=description)
+            for skill, importance, description in map(_gap_fields, match_result['missing_required'])
+        ]
+        preferred = [
+            SkillGap(skill=skill, category=_PREFERRED, importance=importance, description=description)
+            for skill, importance, description in map(_gap_fields, match_result['missing_preferred'])
+        ]
         
-        return gaps
-
+        # Required first, then by importance value
+        required.sort(key=_by_importance, reverse=True)
+        preferred.sort(key=_by_importance, reverse=True)
+        return required + preferred
@@ -1,69 +1,74 @@
 """Functions to generate explanations for scores and recommendations."""
 
+import math
+from bisect import bisect_right
 from typing import Dict, List
 from src.models.analysis_result import RoleScore, SkillGap
 
+# Lower score bounds for each assessment label above "Poor fit"
+_ASSESSMENT_THRESHOLDS = (35, 50, 65, 80)
+_ASSESSMENT_LABELS = ("Poor fit", "Needs improvement", "Moderate fit", "Good fit", "Excellent fit")
+
 
 def generate_score_explanation(score: RoleScore) -> str:
     """Generate human-readable explanation for a role score."""
     score_value = score.overall_score
     
     # Overall assessment
-    if score_value >= 80:
-        assessment = "Excellent fit"
-    elif score_value >= 65:
-        assessment = "Good fit"
-    elif score_value >= 50:
-        assessment = "Moderate fit"
-    elif score_value >= 35:
-        assessment = "Needs improvement"
+    # NaN fails every threshold check, so it gets the lowest label
+    if math.isnan(score_value):
+        assessment = _ASSESSMENT_LABELS[0]
     else:
-        assessment = "Poor fit"
+        assessment = _ASSESSMENT_LABELS[bisect_right(_ASSESSMENT_THRESHOLDS, score_value)]
     
-    explanation = f"Your readiness score for {score.role_name} is {score_value:.1f}/100 ({assessment}).\n\n"
+    parts: List[str] = [
+        f"Your readiness score for {score.role_name} is {score_value:.1f}/100 ({assessment}).\n\n"
+    ]
     
     # Score breakdown
-    explanation += "Score Breakdown:\n"
+    parts.append("Score Breakdown:\n")
     for category, value in score.breakdown.items():
-        explanation += f"  - {category.replace('_', ' ').title()}: {value:.1f}%\n"
+        parts.append(f"  - {category.replace('_', ' ').title()}: {value:.1f}%\n")
     
     # Strengths
     if score.matched_skills:
-        explanation += f"\nStrengths:\n"
-        explanation += f"  - You have {len(score.matched_skills)} matching skills\n"
         top_skills = score.matched_skills[:5]
-        explanation += f"  - Key skills: {', '.join(top_skills)}\n"
+        parts.append("\nStrengths:\n")
+        parts.append(f"  - You have {len(score.matched_skills)} matching skills\n")
+        parts.append(f"  - Key skills: {', '.join(top_skills)}\n")
     
     # Weaknesses
     if score.missing_skills:
         required_missing = [s for s in score.missing_skills if s.category == "required"]
         if required_missing:
-            explanation += f"\nCritical Gaps:\n"
-            explanation += f"  - Missing {len(required_missing)} required skills\n"
             top_missing = required_missing[:3]
-            explanation += f"  - Focus on: {', '.join([s.skill for s in top_missing])}\n"
+            parts.append("\nCritical Gaps:\n")
+            parts.append(f"  - Missing {len(required_missing)} required skills\n")
+            parts.append(f"  - Focus on: {', '.join([s.skill for s in top_missing])}\n")
     
     # Experience
     if score.experience_score < 50:
-        explanation += f"\nNote: Experience level is below ideal. Consider gaining more hands-on experience.\n"
+        parts.append("\nNote: Experience level is below ideal. Consider gaining more hands-on experience.\n")
     
-    return explanation
+    return "".join(parts)
 
 
 def explain_skill_gap(skill_gap: SkillGap) -> str:
     """Generate explanation for a skill gap."""
     importance_text = "critical" if skill_gap.category == "required" else "beneficial"
     
-    explanation = f"Missing skill: {skill_gap.skill}\n"
-    explanation += f"  - Importance: {importance_text} ({skill_gap.category})\n"
+    parts: List[str] = [
+        f"Missing skill: {skill_gap.skill}\n",
+        f"  - Importance: {importance_text} ({skill_gap.category})\n",
+    ]
     
     if skill_gap.description:
-        explanation += f"  - Description: {skill_gap.description}\n"
+        parts.append(f"  - Description: {skill_gap.description}\n")
     
     if skill_gap.learning_resources:
-        explanation += f"  - Learning resources: {', '.join(skill_gap.learning_resources[:3])}\n"
+        parts.append(f"  - Learning resources: {', '.join(skill_gap.learning_resources[:3])}\n")
     
-    return explanation
+    return "".join(parts)
 
 
 def generate_roadmap_summary(roadmap_items: List) -> str:
@@ -73,13 +78,12 @@ def generate_roadmap_summary(roadmap_items: List) -> str:
     
     total_days = sum(item.get('estimated_days', 0) for item in roadmap_items)
     
-    summary = f"Learning Roadmap ({total_days} days estimated):\n\n"
+    parts: List[str] = [f"Learning Roadmap ({total_days} days estimated):\n\n"]
     
     for i, item in enumerate(roadmap_items[:10], 1):  # Top 10 items
-        summary += f"{i}. {item.get('skill', 'N/A')}\n"
-        summary += f"   Priority: {item.get('priority', 'Medium')}\n"
+        parts.append(f"{i}. {item.get('skill', 'N/A')}\n")
+        parts.append(f"   Priority: {item.get('priority', 'Medium')}\n")
         if item.get('estimated_days'):
-            summary += f"   Estimated time: {item['estimated_days']} days\n"
+            parts.append(f"   Estimated time: {item['estimated_days']} days\n")
     
-    return summary
-
+    return "".join(parts)
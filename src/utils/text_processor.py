@@ -1,13 +1,60 @@
 """Text processing utilities."""
 
+import os
 import re
-from typing import List, Optional
+import sys
+from functools import lru_cache
+from typing import FrozenSet, Iterable, List, Optional, Tuple
 try:
     import spacy
     SPACY_AVAILABLE = True
 except ImportError:
     SPACY_AVAILABLE = False
 
+# Optional: RE2 runs the email/phone/degree scans as a linear-time automaton,
+# several times faster than re on text where they rarely match. The sub()
+# patterns stay on re (RE2's per-match overhead makes them slower), as does
+# KeywordScanner, which needs a lookahead.
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+
+def _compile_scan(pattern: str):
+    """
+    Compile an extractor pattern with RE2 when available, else with re.
+    
+    RE2's ``\b``/``\d``/``\s`` are ASCII-only, so the re fallback uses
+    re.ASCII: results must not depend on whether the optional package is
+    installed.
+    """
+    if RE2_AVAILABLE:
+        return re2.compile(pattern)
+    return re.compile(pattern, re.ASCII)
+
+
+# Patterns compiled once at import instead of on every call
+_WS = re.compile(r'\s+')
+_PUNCT = re.compile(r'[^\w\s\.\,\;\:\-\/\(\)]')
+_SKILL_PREFIX = re.compile(r'^(proficient in|experienced with|knowledge of|expert in)\s+')
+_EMAIL = _compile_scan(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+# Phone formats in order of preference; the group number of a match is its rank
+_PHONE = _compile_scan(
+    r'\b(?:(\d{3}-\d{3}-\d{4})'  # 123-456-7890
+    r'|(\(\d{3}\)\s?\d{3}-\d{4})'  # (123) 456-7890
+    r'|(\d{10}))\b'  # 1234567890
+)
+# Bachelor / master / doctorate alternatives folded into one pattern: the
+# groups start with different letters, so one scan finds the same matches
+# (inline flag, since re2.compile takes no re flags)
+_DEGREES = _compile_scan(
+    r'(?i)\b(BS|B\.S\.|Bachelor|BA|B\.A\.|B\.Sc\.|BSc'
+    r'|MS|M\.S\.|Master|MA|M\.A\.|M\.Sc\.|MSc|M\.Tech|MTech'
+    r'|PhD|Ph\.D\.|Doctorate|D\.Sc\.)\b'
+)
+
 
 def clean_text(text: str) -> str:
     """Clean and normalize text."""
@@ -15,16 +62,17 @@ def clean_text(text: str) -> str:
         return ""
     
     # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = _WS.sub(' ', text)
     
     # Remove special characters but keep basic punctuation
-    text = re.sub(r'[^\w\s\.\,\;\:\-\/\(\)]', '', text)
+    text = _PUNCT.sub('', text)
     
     return text.strip()
 
 
+@lru_cache(maxsize=8192)
 def normalize_skill_name(skill: str) -> str:
-    """Normalize skill name for matching."""
+    """Normalize skill name for matching (memoized: the same skills recur constantly)."""
     if not skill:
         return ""
     
@@ -32,17 +80,105 @@ def normalize_skill_name(skill: str) -> str:
     skill = skill.lower().strip()
     
     # Remove common prefixes/suffixes
-    skill = re.sub(r'^(proficient in|experienced with|knowledge of|expert in)\s+', '', skill)
+    skill = _SKILL_PREFIX.sub('', skill)
     
     # Normalize common variations
     skill = skill.replace('_', ' ').replace('-', ' ')
     
     # Remove extra spaces
-    skill = re.sub(r'\s+', ' ', skill).strip()
+    skill = _WS.sub(' ', skill).strip()
     
     return skill
 
 
+def _trie_regex(terms: Iterable[str]) -> str:
+    """
+    Build a regex matching any of ``terms``, factored by common prefix.
+    
+    ``["sql", "spark", "statistics"]`` becomes ``s(?:park|ql|tatistics)``,
+    so the engine tests each shared prefix once instead of once per keyword.
+    Optional tails are greedy, so the longest keyword at a position wins.
+    """
+    root: dict = {}
+    for term in terms:
+        node = root
+        for char in term:
+            node = node.setdefault(char, {})
+        node[''] = None
+    
+    def build(node: dict) -> str:
+        # Unbranched runs are walked in a loop, so recursion depth follows the
+        # number of branch points rather than the keyword length
+        prefix = []
+        while len(node) == 1 and '' not in node:
+            char, node = next(iter(node.items()))
+            prefix.append(re.escape(char))
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''.join(prefix)
+        group = '(?:' + '|'.join(branches) + ')'
+        return ''.join(prefix) + (group + '?' if '' in node else group)
+    
+    return build(root)
+
+
+class KeywordScanner:
+    """
+    Find which of a fixed set of keywords occur in a string, in one pass.
+    
+    All keywords are compiled into a single prefix-factored regex inside a
+    lookahead, so one scan reports a hit at every position (overlapping
+    keywords included) instead of one ``in`` test per keyword. Results are
+    memoized per input string.
+    """
+    
+    def __init__(self, terms: Iterable[str], cache_size: int = 1024):
+        """
+        Initialize the scanner.
+        
+        Args:
+            terms: Keywords to look for (matched as plain substrings)
+            cache_size: Number of scanned strings to memoize
+        """
+        # Interned, so hits compare by identity against the callers' keyword tables
+        ordered = sorted({sys.intern(t) for t in terms}, key=len, reverse=True)
+        self.terms = frozenset(ordered)
+        self._pattern = re.compile("(?=({}))".format(_trie_regex(ordered))) if ordered else None
+        # Longest alternative wins at a position; every keyword that is a
+        # prefix of it matches there too
+        self._implied = {t: frozenset(u for u in ordered if t.startswith(u)) for t in ordered}
+        self.scan = lru_cache(maxsize=cache_size)(self._scan)
+    
+    def _scan(self, text: str) -> FrozenSet[str]:
+        """Return the keywords contained in ``text``."""
+        if self._pattern is None or not text:
+            return frozenset()
+        hits = set()
+        for match in self._pattern.finditer(text):
+            hits |= self._implied[match.group(1)]
+        return frozenset(hits)
+
+
+# Components of en_core_web_sm that entity extraction doesn't use; ner has
+# its own embedded tok2vec, so the shared one only feeds tagger and parser
+_NER_DISABLED_PIPES = ("tok2vec", "tagger", "parser", "senter", "attribute_ruler", "lemmatizer")
+
+
+@lru_cache(maxsize=1)
+def _load_nlp(disable: Tuple[str, ...]):
+    """
+    Load the spaCy model once per process.
+    
+    Returns None if the model isn't installed; that outcome is cached too, so
+    callers don't retry the load on every call.
+    """
+    try:
+        # User needs to download the model
+        return spacy.load("en_core_web_sm", disable=list(disable))
+    except OSError:
+        return None
+
+
 def extract_entities(text: str, entity_types: Optional[List[str]] = None) -> List[str]:
     """
     Extract named entities from text using spaCy.
@@ -58,59 +194,85 @@ def extract_entities(text: str, entity_types: Optional[List[str]] = None) -> Lis
     if not SPACY_AVAILABLE:
         return []
     
-    try:
-        # Try to load spaCy model (user needs to download it)
-        nlp = spacy.load("en_core_web_sm")
-    except OSError:
+    nlp = _load_nlp(_NER_DISABLED_PIPES)
+    if nlp is None:
         # Model not installed - return empty list
         return []
     
-    doc = nlp(text)
+    return _entity_texts(nlp(text), entity_types)
+
+
+def extract_entities_batch(
+    texts: Iterable[str],
+    entity_types: Optional[List[str]] = None,
+    batch_size: Optional[int] = None
+) -> List[List[str]]:
+    """
+    Extract named entities from many texts with one ``nlp.pipe`` pass.
+    
+    spaCy batches the documents internally, which is much faster than calling
+    extract_entities() in a loop.
+    
+    Args:
+        texts: Input texts
+        entity_types: Types of entities to extract (None extracts all)
+        batch_size: Documents per batch (default: SPACY_BATCH_SIZE env var, or 32)
+    
+    Returns:
+        One list of extracted entity texts per input text
+    """
+    texts = list(texts)
+    if not SPACY_AVAILABLE:
+        return [[] for _ in texts]
+    
+    nlp = _load_nlp(_NER_DISABLED_PIPES)
+    if nlp is None:
+        return [[] for _ in texts]
     
-    entities = []
-    for ent in doc.ents:
-        if entity_types is None or ent.label_ in entity_types:
-            entities.append(ent.text)
+    if batch_size is None:
+        batch_size = int(os.getenv("SPACY_BATCH_SIZE", "32"))
     
-    return entities
+    return [
+        _entity_texts(doc, entity_types)
+        for doc in nlp.pipe(texts, batch_size=batch_size, n_process=1)
+    ]
+
+
+def _entity_texts(doc, entity_types: Optional[List[str]]) -> List[str]:
+    """Texts of the entities in ``doc`` (optionally only the given types)."""
+    return [
+        ent.text
+        for ent in doc.ents
+        if entity_types is None or ent.label_ in entity_types
+    ]
 
 
 def extract_email(text: str) -> Optional[str]:
     """Extract email address from text."""
-    pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    match = re.search(pattern, text)
+    if not text or '@' not in text:
+        return None
+    match = _EMAIL.search(text)
     return match.group() if match else None
 
 
 def extract_phone(text: str) -> Optional[str]:
     """Extract phone number from text."""
-    # Common phone patterns
-    patterns = [
-        r'\b\d{3}-\d{3}-\d{4}\b',  # 123-456-7890
-        r'\b\(\d{3}\)\s?\d{3}-\d{4}\b',  # (123) 456-7890
-        r'\b\d{10}\b',  # 1234567890
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text)
-        if match:
+    if not text or len(text) < 10:  # shortest format is 10 digits
+        return None
+    # One scan over the text; the first match of the most preferred format wins
+    best = None
+    for match in _PHONE.finditer(text):
+        if match.lastindex == 1:
             return match.group()
+        if best is None or match.lastindex < best.lastindex:
+            best = match
     
-    return None
+    return best.group() if best else None
 
 
 def extract_degrees(text: str) -> List[str]:
     """Extract degree names from text."""
-    degree_patterns = [
-        r'\b(BS|B\.S\.|Bachelor|BA|B\.A\.|B\.Sc\.|BSc)\b',
-        r'\b(MS|M\.S\.|Master|MA|M\.A\.|M\.Sc\.|MSc|M\.Tech|MTech)\b',
-        r'\b(PhD|Ph\.D\.|Doctorate|D\.Sc\.)\b',
-    ]
-    
-    degrees = []
-    for pattern in degree_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        degrees.extend(matches)
-    
-    return list(set(degrees))
+    if not text or len(text) < 2:  # shortest degree codes are two letters
+        return []
+    return list(set(_DEGREES.findall(text)))
 
@@ -12,8 +12,11 @@ no demo, sample, or dummy data is used anywhere in this module.
 from __future__ import annotations
 
 import json
+import math
+from bisect import bisect_right
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Any, Dict, List, Optional, Tuple
 
 import streamlit as st
 
@@ -24,11 +27,13 @@ try:
         delete_profile,
         save_score_snapshot,
         get_snapshots_for_profile,
+        get_snapshots_for_roles,
         get_distinct_roles,
         delete_snapshot,
         clear_snapshots_for_profile,
         get_before_after,
         upsert_skill_status,
+        upsert_skill_statuses_bulk,
         get_skill_statuses,
     )
     _DB_OK = True
@@ -36,6 +41,37 @@ except Exception as _db_err:
     _DB_OK = False
     _DB_ERR = str(_db_err)
 
+try:
+    import plotly.graph_objects as go
+    _PLOTLY_OK = True
+    # Force the standard json engine to avoid orjson circular-import issues
+    try:
+        import plotly.io as _pio
+        _pio.json.config.default_engine = "json"
+    except Exception:
+        pass
+except ImportError:
+    _PLOTLY_OK = False
+
+try:
+    import pandas as pd
+    _PANDAS_OK = True
+except ImportError:
+    _PANDAS_OK = False
+
+
+# Skill chip markup: the styling is emitted once per render (see
+# render_tracking_tab), each chip only carries its class
+_CHIP_CSS = (
+    "<style>"
+    ".chip-ok,.chip-bad{border-radius:4px;padding:2px 6px;font-size:.85rem;}"
+    ".chip-ok{background:#d4edda;}"
+    ".chip-bad{background:#f8d7da;}"
+    "</style>"
+)
+_MATCHED_CHIP = '<span class="chip-ok">{}</span>'
+_MISSING_CHIP = '<span class="chip-bad">{}</span>'
+
 
 # ── tiny helpers ──────────────────────────────────────────────────────────────
 
@@ -46,17 +82,59 @@ def _fmt_dt(s: str) -> str:
         return s
 
 
+# Lower score bounds for yellow and green; below the first is red
+_SCORE_COLOR_THRESHOLDS = (50, 75)
+_SCORE_COLORS = ("#dc3545", "#ffc107", "#28a745")
+
+
 def _score_color(v: float) -> str:
-    return "#28a745" if v >= 75 else "#ffc107" if v >= 50 else "#dc3545"
+    # NaN compares false against every bound, so bisect would put it last
+    if math.isnan(v):
+        return _SCORE_COLORS[0]
+    return _SCORE_COLORS[bisect_right(_SCORE_COLOR_THRESHOLDS, v)]
 
 
 def _safe_float(v: Any, default: float = 0.0) -> float:
+    # Pipeline scores are already numbers and missing keys give None; only
+    # other values (e.g. strings) go through the raising float() path
+    if type(v) is float:
+        return v
+    if v is None:
+        return default
+    if isinstance(v, int):
+        return float(v)
     try:
         return float(v)
     except Exception:
         return default
 
 
+# ── cached reads ──────────────────────────────────────────────────────────────
+# Every widget interaction reruns the page; these keep reruns from re-querying
+# SQLite. Profiles and role lists are already cached in history_manager.
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_snaps(pid: int, role: Optional[str] = None) -> List[Dict[str, Any]]:
+    return get_snapshots_for_profile(pid, target_role=role)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_snaps_for_roles(pid: int, roles: tuple) -> Dict[str, List[Dict[str, Any]]]:
+    return get_snapshots_for_roles(pid, list(roles))
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_skill_statuses(pid: int) -> Dict[str, str]:
+    return get_skill_statuses(pid)
+
+
+def _invalidate_cached_reads() -> None:
+    """Drop cached snapshots/statuses after a write."""
+    _cached_snaps.clear()
+    _cached_snaps_for_roles.clear()
+    _cached_skill_statuses.clear()
+
+
 # ── public entry point ────────────────────────────────────────────────────────
 
 def render_tracking_tab(
@@ -68,6 +146,7 @@ def render_tracking_tab(
         st.error(f"History database failed to load: {_DB_ERR}")
         return
 
+    st.markdown(_CHIP_CSS, unsafe_allow_html=True)
     st.markdown("## 📈 Tracking & History")
     st.caption(
         "Every number shown here comes from your real analysis runs. "
@@ -192,11 +271,12 @@ def _step71(analysis_results: Dict[str, Any], selected_role: Optional[str]) -> N
                     missing_skills=missing,
                     notes=notes,
                 )
-                # Persist skill acquisition data
-                for s in matched:
-                    upsert_skill_status(profile_id, s, "acquired")
-                for s in missing:
-                    upsert_skill_status(profile_id, s, "missing")
+                # Persist skill acquisition data (one transaction)
+                upsert_skill_statuses_bulk(
+                    profile_id,
+                    [(s, "acquired") for s in matched] + [(s, "missing") for s in missing],
+                )
+                _invalidate_cached_reads()
                 st.success(
                     f"✅ Snapshot #{sid} saved — "
                     f"{datetime.now().strftime('%d %b %Y %H:%M:%S')}"
@@ -224,9 +304,9 @@ def _history_section(profile_id: int) -> None:
     )
 
     snaps = (
-        get_snapshots_for_profile(profile_id)
+        _cached_snaps(profile_id)
         if role_filter == "All roles"
-        else get_snapshots_for_profile(profile_id, target_role=role_filter)
+        else _cached_snaps(profile_id, role_filter)
     )
 
     if not snaps:
@@ -282,31 +362,25 @@ def _history_section(profile_id: int) -> None:
             if snap.get("matched_skills"):
                 st.markdown(
                     "**Matched:** "
-                    + " ".join(
-                        f'<span style="background:#d4edda;border-radius:4px;'
-                        f'padding:2px 6px;font-size:.85rem;">{s}</span>'
-                        for s in (snap["matched_skills"] or [])[:15]
-                    ),
+                    + " ".join(map(_MATCHED_CHIP.format, islice(snap["matched_skills"], 15))),
                     unsafe_allow_html=True,
                 )
             if snap.get("missing_skills"):
                 st.markdown(
                     "**Missing:** "
-                    + " ".join(
-                        f'<span style="background:#f8d7da;border-radius:4px;'
-                        f'padding:2px 6px;font-size:.85rem;">{s}</span>'
-                        for s in (snap["missing_skills"] or [])[:15]
-                    ),
+                    + " ".join(map(_MISSING_CHIP.format, islice(snap["missing_skills"], 15))),
                     unsafe_allow_html=True,
                 )
 
             if st.button(f"🗑️ Delete #{snap['id']}", key=f"del_{snap['id']}"):
                 delete_snapshot(snap["id"])
+                _invalidate_cached_reads()
                 st.rerun()
 
     st.divider()
     if st.button("🗑️ Clear ALL snapshots for this profile", key="ph7_clear_all"):
         n = clear_snapshots_for_profile(profile_id)
+        _invalidate_cached_reads()
         st.warning(f"Deleted {n} snapshot(s).")
         st.rerun()
 
@@ -352,103 +426,114 @@ def _step72() -> None:
     _skill_status_panel(pid)
 
 
+_CHART_PALETTE = (
+    "#1f77b4", "#ff7f0e", "#2ca02c", "#d62728",
+    "#9467bd", "#8c564b", "#e377c2", "#bcbd22",
+)
+
+# One entry per selected role that has data:
+# (palette slot, role, ((saved_at label, score, note, snapshot id), ...))
+_ChartPayload = Tuple[Tuple[int, str, Tuple[Tuple[str, float, str, int], ...]], ...]
+
+
+@st.cache_data(ttl=120, show_spinner=False)
+def _build_chart_figure(payload: _ChartPayload, username: str) -> Dict[str, Any]:
+    """Build the growth chart as a plain figure dict, cached on the plotted data."""
+    fig = go.Figure()
+    for slot, role, points in payload:
+        xs, ys, notes, ids = zip(*points)
+        col = _CHART_PALETTE[slot % len(_CHART_PALETTE)]
+
+        fig.add_trace(go.Scatter(
+            x=list(xs), y=list(ys),
+            mode="lines+markers",
+            name=role[:45],
+            line=dict(color=col, width=3),
+            marker=dict(size=10, color=col, line=dict(width=2, color="white")),
+            customdata=list(zip(ids, notes)),
+            hovertemplate=(
+                "<b>%{fullData.name}</b><br>"
+                "Score: <b>%{y:.1f}/100</b><br>"
+                "Date: %{x}<br>"
+                "Note: %{customdata[1]}<br>"
+                "Snapshot #%{customdata[0]}"
+                "<extra></extra>"
+            ),
+        ))
+
+    fig.update_layout(
+        title=dict(text=f"🚀 Skill Growth — {username}", font=dict(size=18)),
+        xaxis=dict(title="Saved At", tickangle=-35),
+        yaxis=dict(title="Overall Readiness Score (/100)", range=[0, 105]),
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        hovermode="x unified",
+        plot_bgcolor="#fafafa",
+        paper_bgcolor="white",
+        height=480,
+        shapes=[
+            dict(type="line", y0=75, y1=75, x0=0, x1=1, xref="paper",
+                 line=dict(color="#28a745", width=1, dash="dot")),
+            dict(type="line", y0=50, y1=50, x0=0, x1=1, xref="paper",
+                 line=dict(color="#ffc107", width=1, dash="dot")),
+        ],
+        annotations=[
+            dict(x=1, y=75, xref="paper", yref="y", text="75 – Good",
+                 showarrow=False, font=dict(size=11, color="#28a745"), xanchor="right"),
+            dict(x=1, y=50, xref="paper", yref="y", text="50 – Average",
+                 showarrow=False, font=dict(size=11, color="#ffc107"), xanchor="right"),
+        ],
+    )
+    return fig.to_dict()
+
+
 def _draw_chart(pid: int, username: str, sel_roles: List[str]) -> None:
-    try:
-        import plotly.graph_objects as go
-
-        palette = [
-            "#1f77b4", "#ff7f0e", "#2ca02c", "#d62728",
-            "#9467bd", "#8c564b", "#e377c2", "#bcbd22",
-        ]
-        fig = go.Figure()
-        has_data = False
-
-        for i, role in enumerate(sel_roles):
-            snaps = get_snapshots_for_profile(pid, target_role=role)
-            if not snaps:
-                continue
-            has_data = True
-            xs    = [_fmt_dt(s["saved_at"])    for s in snaps]
-            ys    = [s["overall_score"]         for s in snaps]
-            notes = [s.get("notes") or ""       for s in snaps]
-            ids   = [s["id"]                    for s in snaps]
-            col   = palette[i % len(palette)]
-
-            fig.add_trace(go.Scatter(
-                x=xs, y=ys,
-                mode="lines+markers",
-                name=role[:45],
-                line=dict(color=col, width=3),
-                marker=dict(size=10, color=col, line=dict(width=2, color="white")),
-                customdata=list(zip(ids, notes)),
-                hovertemplate=(
-                    "<b>%{fullData.name}</b><br>"
-                    "Score: <b>%{y:.1f}/100</b><br>"
-                    "Date: %{x}<br>"
-                    "Note: %{customdata[1]}<br>"
-                    "Snapshot #%{customdata[0]}"
-                    "<extra></extra>"
-                ),
+    # Spellings of one role match the same snapshots (lookups use
+    # lower(trim(role))), so keep only the first of each to avoid duplicate series
+    unique_roles: Dict[str, str] = {}
+    for role in sel_roles:
+        unique_roles.setdefault(role.strip().lower(), role)
+    sel_roles = list(unique_roles.values())
+
+    # One query for every selected role instead of one per role
+    snaps_by_role = _cached_snaps_for_roles(pid, tuple(sel_roles))
+    if _PLOTLY_OK:
+        # Hashable snapshot of exactly what is plotted; unchanged data on a
+        # rerun hits the figure cache instead of rebuilding the figure
+        payload = tuple(
+            (i, role, tuple(
+                (_fmt_dt(s["saved_at"]), s["overall_score"], s.get("notes") or "", s["id"])
+                for s in snaps_by_role[role]
             ))
-
-        if not has_data:
+            for i, role in enumerate(sel_roles)
+            if snaps_by_role.get(role)
+        )
+        if not payload:
             st.info("No snapshot data for the selected roles yet.")
             return
 
-        fig.update_layout(
-            title=dict(text=f"🚀 Skill Growth — {username}", font=dict(size=18)),
-            xaxis=dict(title="Saved At", tickangle=-35),
-            yaxis=dict(title="Overall Readiness Score (/100)", range=[0, 105]),
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-            hovermode="x unified",
-            plot_bgcolor="#fafafa",
-            paper_bgcolor="white",
-            height=480,
-            shapes=[
-                dict(type="line", y0=75, y1=75, x0=0, x1=1, xref="paper",
-                     line=dict(color="#28a745", width=1, dash="dot")),
-                dict(type="line", y0=50, y1=50, x0=0, x1=1, xref="paper",
-                     line=dict(color="#ffc107", width=1, dash="dot")),
-            ],
-            annotations=[
-                dict(x=1, y=75, xref="paper", yref="y", text="75 – Good",
-                     showarrow=False, font=dict(size=11, color="#28a745"), xanchor="right"),
-                dict(x=1, y=50, xref="paper", yref="y", text="50 – Average",
-                     showarrow=False, font=dict(size=11, color="#ffc107"), xanchor="right"),
-            ],
-        )
-        # Force the standard json engine to avoid orjson circular-import issues
-        try:
-            import plotly.io as _pio
-            _pio.json.config.default_engine = "json"
-        except Exception:
-            pass
-        st.plotly_chart(fig, use_container_width=True)
-
-    except ImportError:
-        # Fallback: st.line_chart (no plotly needed)
-        try:
-            import pandas as pd
-        except ImportError:
-            st.warning("Install plotly and pandas for charts: `pip install plotly pandas`")
-            return
+        st.plotly_chart(go.Figure(_build_chart_figure(payload, username)), use_container_width=True)
+        return
 
-        frames = []
-        for role in sel_roles:
-            for s in get_snapshots_for_profile(pid, target_role=role):
-                frames.append({"saved_at": _fmt_dt(s["saved_at"]), role: s["overall_score"]})
-        if not frames:
-            st.info("No data to display.")
-            return
-        import pandas as pd
-        df = pd.DataFrame(frames).set_index("saved_at")
-        st.line_chart(df)
+    # Fallback: st.line_chart (no plotly needed)
+    if not _PANDAS_OK:
+        st.warning("Install plotly and pandas for charts: `pip install plotly pandas`")
+        return
+
+    frames = []
+    for role in sel_roles:
+        for s in snaps_by_role.get(role, []):
+            frames.append({"saved_at": _fmt_dt(s["saved_at"]), role: s["overall_score"]})
+    if not frames:
+        st.info("No data to display.")
+        return
+    df = pd.DataFrame(frames).set_index("saved_at")
+    st.line_chart(df)
 
 
 def _skill_status_panel(pid: int) -> None:
     st.markdown("#### 🎯 Skill Acquisition Progress")
 
-    statuses = get_skill_statuses(pid)
+    statuses = _cached_skill_statuses(pid)
     if not statuses:
         st.info("Skill data will appear here after you save a snapshot.")
         return
@@ -494,5 +579,6 @@ def _skill_status_panel(pid: int) -> None:
         )
         if st.button("Update", key="ph7_skill_update"):
             upsert_skill_status(pid, skill, nw)
+            _invalidate_cached_reads()
             st.success(f"Updated `{skill}` → **{nw}**")
             st.rerun()